@@ -2,7 +2,7 @@
 Command-line interface for curlpad.
 
 This module provides the main CLI entry point and handles:
-    - Argument parsing (--help, --version, --install, --debug)
+    - Argument parsing (--help, --version, --install, --debug, --sequential)
     - Main application flow
     - User confirmation prompts
     - Orchestrating all modules
@@ -27,25 +27,177 @@ Flow:
     4. Create template file
     5. Open editor with autocomplete
     6. Extract commands from edited file
-    7. Format JSON (if jq available)
+    7. Compact JSON payloads (jq only as a fallback)
     8. Validate commands
     9. Prompt for confirmation
     10. Execute commands
 """
 
+import functools
 import os
 import sys
-from typing import List
+from types import SimpleNamespace
+from typing import List, Optional
 
-from curlpad.commands import extract_commands, format_json_with_jq, run_command, validate_command
-from curlpad.constants import __version__
-from curlpad.dependencies import check_dependencies, install_deps, get_editor
-from curlpad.editor import open_editor
+from curlpad.constants import IS_WINDOWS, __version__
 from curlpad.output import print_error, print_info, print_warning
-from curlpad.templates import create_template_file
 from curlpad import utils
 from curlpad.utils import debug_print
 
+# Banner around the final command list, built once and written with a single call each
+_FINAL_COMMANDS_RULE = "-" * 40
+_FINAL_COMMANDS_HEADER = f"\n📋 Final command(s) to execute:\n{_FINAL_COMMANDS_RULE}\n"
+_FINAL_COMMANDS_FOOTER = f"{_FINAL_COMMANDS_RULE}\n"
+
+# Boolean flags recognized by _scan_args(), mapped to their argparse dest names
+_FLAG_DESTS = {
+    '--help': 'help', '-h': 'help',
+    '--version': 'version', '-v': 'version',
+    '--install': 'install',
+    '--debug': 'debug',
+    '--sequential': 'sequential',
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _message_box():
+    """
+    Return user32.MessageBoxW with its signature configured (Windows only).
+
+    ctypes is imported on first use rather than at module import, so
+    non-Windows runs and the normal stdin path never pay for it. The
+    lru_cache keeps the configured function for any later prompt.
+    """
+    import ctypes
+    from ctypes import wintypes
+
+    message_box = ctypes.windll.user32.MessageBoxW  # type: ignore[attr-defined]
+    message_box.argtypes = (wintypes.HWND, wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.UINT)
+    message_box.restype = ctypes.c_int
+    return message_box
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser():
+    """
+    Build the argparse parser used when _scan_args() cannot handle argv.
+    
+    Imported and constructed lazily, then cached so repeated main() calls
+    (tests, embedded use) reuse the same parser.
+    
+    Returns:
+        Configured argparse.ArgumentParser
+    """
+    import argparse
+
+    # Initialize argument parser
+    # add_help=False: We handle --help manually to show custom help message
+    # allow_abbrev=False: Options must be spelled exactly (no prefix matching scan)
+    parser = argparse.ArgumentParser(add_help=False, allow_abbrev=False)
+    
+    # Define command-line arguments:
+    # --help, -h: Show help message and exit
+    # --version, -v: Show version information and exit
+    # --install: Install missing dependencies (vim, jq) and exit
+    # --debug: Enable verbose debug logging throughout the application
+    # --url: Pre-populate template with base URL
+    # --sequential: Run commands one at a time (for commands that depend on each other)
+    parser.add_argument('--help', '-h', action='store_true')
+    parser.add_argument('--version', '-v', action='store_true')
+    parser.add_argument('--install', action='store_true')
+    parser.add_argument('--debug', action='store_true')
+    parser.add_argument('--url', type=str, help='Pre-populate template with base URL (e.g., --url=https://www.example.com)')
+    parser.add_argument('--sequential', action='store_true')
+    return parser
+
+
+def _scan_args(argv: List[str]) -> Optional[SimpleNamespace]:
+    """
+    Parse the common command-line shapes without importing argparse.
+    
+    Handles exactly the documented flags (--help/-h, --version/-v,
+    --install, --debug, --sequential, --url=URL and --url URL).
+    
+    Args:
+        argv: Command-line arguments without the program name
+        
+    Returns:
+        Namespace with help, version, install, debug, sequential and url
+        attributes (same as argparse would produce), or None if any token
+        is not recognized and main() should fall back to argparse
+    """
+    args = SimpleNamespace(help=False, version=False, install=False, debug=False, sequential=False, url=None)
+    i = 0
+    while i < len(argv):
+        token = argv[i]
+        dest = _FLAG_DESTS.get(token)
+        if dest is not None:
+            setattr(args, dest, True)
+        elif token.startswith('--url='):
+            args.url = token[len('--url='):]
+        elif token == '--url' and i + 1 < len(argv) and not argv[i + 1].startswith('-'):
+            args.url = argv[i + 1]
+            i += 1
+        else:
+            return None
+        i += 1
+    return args
+
+
+def _confirm_tty() -> Optional[bool]:
+    """
+    Ask for confirmation on an interactive terminal via input().
+    
+    Returns:
+        True if the user pressed Enter, False on Ctrl+C,
+        None if stdin could not be read
+    """
+    try:
+        print("Press Enter to run, or Ctrl+C to cancel... ", end='', flush=True)
+        input()
+        debug_print("User confirmed execution via stdin")
+        return True
+    except KeyboardInterrupt:
+        debug_print("User cancelled via Ctrl+C")
+        print("\nOperation cancelled.")
+        return False
+    except (RuntimeError, EOFError, OSError) as exc:
+        debug_print(f"stdin unavailable: {type(exc).__name__}: {exc}")
+        return None
+
+
+def _confirm_pipe() -> Optional[bool]:
+    """
+    Take confirmation from non-interactive stdin (pipe, file, CI runner).
+    
+    Does a single os.read() on the stdin file descriptor instead of going
+    through input()'s readline machinery. Any data (e.g. a newline fed by
+    an orchestrator) counts as confirmation. EOF (stdin already closed) is
+    no answer, as EOFError from input() was: confirm_execution() then uses
+    its fallbacks (MessageBox on Windows, warn and proceed elsewhere).
+    
+    Returns:
+        True once stdin sent data, False on Ctrl+C,
+        None if stdin has no usable file descriptor or is at EOF
+    """
+    try:
+        print("Press Enter to run, or Ctrl+C to cancel... ", end='', flush=True)
+        data = os.read(sys.stdin.fileno(), 4096)
+    except KeyboardInterrupt:
+        debug_print("User cancelled via Ctrl+C")
+        print("\nOperation cancelled.")
+        return False
+    except (ValueError, OSError) as exc:  # io.UnsupportedOperation is both
+        debug_print(f"stdin unavailable: {type(exc).__name__}: {exc}")
+        return None
+    print()
+    if not data:
+        # Let confirm_execution() fall back (MessageBox, or warn and proceed)
+        debug_print("stdin reached EOF; no confirmation read")
+        return None
+    debug_print(f"Confirmation read from non-interactive stdin ({len(data)} bytes)")
+    return True
+
 
 def confirm_execution(commands: List[str]) -> bool:
     """
@@ -63,44 +215,39 @@ def confirm_execution(commands: List[str]) -> bool:
         True if user confirms execution, False if cancelled
         
     Flow:
-        1. Try to use stdin for interactive prompt
+        1. Try to use stdin: input() on a terminal, a single os.read() on a pipe
         2. If stdin fails, try Windows MessageBox (if on Windows)
         3. If all fail, proceed without confirmation (with warning)
     """
-    debug_print(f"confirm_execution called with {len(commands)} command(s)")
-    debug_print(f"Platform: {os.name}, stdin available: {sys.stdin is not None}")
+    if utils.DEBUG:
+        debug_print(f"confirm_execution called with {len(commands)} command(s)")
+        debug_print(f"Platform: {os.name}, stdin available: {sys.stdin is not None}")
     
     # Try to use stdin first (even if isatty() returns False in frozen binaries)
     # With console=True, stdin should work even in frozen binaries
     if sys.stdin is not None:
         debug_print("Attempting to use stdin for confirmation")
         try:
-            # Try to use stdin - this works even if isatty() returns False
-            print("Press Enter to run, or Ctrl+C to cancel... ", end='', flush=True)
-            input()
-            debug_print("User confirmed execution via stdin")
-            return True
-        except KeyboardInterrupt:
-            debug_print("User cancelled via Ctrl+C")
-            print("\nOperation cancelled.")
-            return False
-        except (RuntimeError, EOFError, OSError) as exc:
-            debug_print(f"stdin unavailable: {type(exc).__name__}: {exc}")
-            # Fall through to MessageBox fallback
+            interactive = sys.stdin.isatty()
+        except (ValueError, OSError):
+            interactive = False
+        # confirmed: True/False once stdin answered, None if stdin is unusable
+        confirmed = _confirm_tty() if interactive else _confirm_pipe()
+        if confirmed is not None:
+            return confirmed
+        # Fall through to MessageBox fallback
 
     # Fallback to MessageBox on Windows if stdin failed
-    if os.name == 'nt':
+    if IS_WINDOWS:
         debug_print("Attempting Windows MessageBox fallback")
         try:
-            import ctypes
-
             MB_OKCANCEL = 0x00000001
             MB_ICONINFORMATION = 0x00000040
             IDOK = 1
 
             message = "Run the following command(s)?\n\n" + "\n".join(commands)
             debug_print(f"Showing MessageBox with {len(commands)} command(s)")
-            result = ctypes.windll.user32.MessageBoxW(  # type: ignore[attr-defined]
+            result = _message_box()(
                 None,
                 message,
                 "curlpad",
@@ -121,13 +268,18 @@ def confirm_execution(commands: List[str]) -> bool:
     return True
 
 
-def show_help() -> None:
+@functools.lru_cache(maxsize=1)
+def _help_text() -> str:
     """
-    Display help message.
-    
-    Shows usage information, options, examples, and dependencies.
+    Build the help message once per process.
+
+    sys.argv[0] does not change after startup, so the interpolated text is
+    cached. The trailing newline that print() used to add is included.
+
+    Returns:
+        Complete help text, ready for sys.stdout.write()
     """
-    help_text = f"""
+    return f"""
 curlpad - A simple curl editor for the command line
 
 Usage: {sys.argv[0]} [OPTIONS]
@@ -140,6 +292,7 @@ Options:
   --install       Install missing dependencies (vim, jq)
   --debug         Enable extremely verbose debug output
   --url URL       Pre-populate template with base URL
+  --sequential    Run commands one at a time (default: in parallel)
 
 Examples:
   {sys.argv[0]}                     # Start editor with curl autocomplete
@@ -157,8 +310,21 @@ Dependencies:
   - nvim or vim     : For editing with autocomplete
   - curl            : For executing commands
   - jq              : For JSON formatting (optional)
+
 """
-    print(help_text)
+
+
+# _VERSION_TEXT: Version line, built once at import (__version__ is constant)
+_VERSION_TEXT = f"curlpad version {__version__}\n"
+
+
+def show_help() -> None:
+    """
+    Display help message.
+    
+    Shows usage information, options, examples, and dependencies.
+    """
+    sys.stdout.write(_help_text())
 
 
 def show_version() -> None:
@@ -167,7 +333,7 @@ def show_version() -> None:
     
     Shows the application version from constants.py.
     """
-    print(f"curlpad version {__version__}")
+    sys.stdout.write(_VERSION_TEXT)
 
 
 def main() -> None:
@@ -188,43 +354,34 @@ def main() -> None:
         --version, -v: Show version and exit
         --install: Install dependencies and exit
         --debug: Enable debug mode (verbose logging)
+        --sequential: Run commands one at a time instead of in parallel
         
     Flow:
-        1. Parse arguments
+        1. Parse arguments (hand-rolled scan; argparse only for unusual argv)
         2. Set DEBUG flag if --debug provided
         3. Handle --help, --version, --install flags
         4. Check curl is installed
         5. Create template file with curl examples
         6. Open editor (nvim/vim) with autocomplete
         7. Extract curl commands from edited file
-        8. Format JSON in commands (if jq available)
+        8. Compact JSON in commands (jq only as a fallback)
         9. Validate commands
         10. Display commands to user
         11. Prompt for confirmation
-        12. Execute commands one by one
+        12. Execute commands (in parallel unless --sequential)
     """
-    import argparse
-    
-    # Initialize argument parser
-    # add_help=False: We handle --help manually to show custom help message
-    parser = argparse.ArgumentParser(add_help=False)
-    
-    # Define command-line arguments:
-    # --help, -h: Show help message and exit
-    # --version, -v: Show version information and exit
-    # --install: Install missing dependencies (vim, jq) and exit
-    # --debug: Enable verbose debug logging throughout the application
-    # --url: Pre-populate template with base URL
-    parser.add_argument('--help', '-h', action='store_true')
-    parser.add_argument('--version', '-v', action='store_true')
-    parser.add_argument('--install', action='store_true')
-    parser.add_argument('--debug', action='store_true')
-    parser.add_argument('--url', type=str, help='Pre-populate template with base URL (e.g., --url=https://www.example.com)')
+    # Fast path: scan argv for the known flags by hand (no argparse import)
+    # args: Parsed flags, or None if argv has a shape the scanner does not handle
+    args = _scan_args(sys.argv[1:])
+
+    if args is None:
+        # Slow path: let argparse handle unusual argv shapes (unknown flags, --url without value, etc.)
+        parser = _build_parser()
 
-    # Parse command-line arguments
-    # args: Parsed arguments (contains help, version, install, debug flags)
-    # unknown: Unrecognized arguments (not used, but kept for compatibility)
-    args, unknown = parser.parse_known_args()
+        # Parse command-line arguments
+        # args: Parsed arguments (contains help, version, install, debug flags)
+        # unknown: Unrecognized arguments (not used, but kept for compatibility)
+        args, unknown = parser.parse_known_args()
 
     # Set global DEBUG flag in utils module
     # This enables verbose logging throughout the application
@@ -250,9 +407,17 @@ def main() -> None:
         return
 
     if args.install:
+        from curlpad.dependencies import install_deps
         install_deps()  # Install vim and jq using platform-specific package managers
         return
 
+    # Imported only past the early exits: --help/--version/--install never
+    # need the commands/editor/templates modules (or subprocess, shlex, re)
+    from curlpad.commands import extract_commands, format_json_with_jq, run_commands, validate_command
+    from curlpad.dependencies import check_dependencies
+    from curlpad.editor import open_editor
+    from curlpad.templates import create_template_file
+
     # Check dependencies
     # Verifies that curl is installed (required for executing HTTP requests)
     # Raises SystemExit if curl is not found
@@ -263,7 +428,7 @@ def main() -> None:
     # Create template file
     # Creates a temporary .sh file with commented curl examples
     # Returns: Path to the created template file
-    # The file is added to temp_files list for automatic cleanup on exit
+    # The file is added to temp_files set for automatic cleanup on exit
     debug_print("Creating template file...")
     base_url = args.url if args.url else None
     if base_url:
@@ -295,38 +460,35 @@ def main() -> None:
         print_warning("No uncommented command found. Exiting.")
         return
 
-    # Format JSON in commands if jq is available
-    # Attempts to format JSON strings in curl commands using jq
-    # If jq is not available, returns original commands unchanged
+    # Compact JSON payloads in commands
+    # Valid JSON is compacted in-process (whitespace only, tokens kept as written);
+    # payloads json rejects go through jq, or stay unchanged if jq is not installed
     # This improves readability of JSON payloads in curl commands
-    debug_print("Formatting JSON in commands (if jq available)...")
+    debug_print("Compacting JSON in commands...")
     commands = format_json_with_jq(commands)
     debug_print(f"JSON formatting complete, {len(commands)} command(s) ready")
 
     # Validate commands
-    # Checks each command to ensure it's a valid curl command
-    # Basic validation: command must start with 'curl'
-    # Raises SystemExit if invalid command is found
+    # Checks each command against the allowlist in validate_command()
+    # All invalid commands are collected and reported together in one message
+    # Raises SystemExit (via print_error) if any invalid command is found
     debug_print(f"Validating {len(commands)} command(s)...")
-    for i, cmd in enumerate(commands, 1):
-        debug_print(f"Validating command {i}/{len(commands)}: {cmd[:80]}{'...' if len(cmd) > 80 else ''}")
-        if not validate_command(cmd):
-            debug_print(f"Command {i} validation FAILED")
-            print_error(f"Invalid curl command: {cmd}")
-        else:
-            debug_print(f"Command {i} validation PASSED")
+    # invalid: Commands rejected by validate_command(), in original order
+    invalid = [cmd for cmd in commands if not validate_command(cmd)]
+    if invalid:
+        debug_print(f"{len(invalid)} command(s) failed validation")
+        print_error("\n".join(f"Invalid curl command: {cmd}" for cmd in invalid))
     debug_print("All commands validated successfully")
 
     # Show final commands to user
     # Displays all commands that will be executed
     # This gives the user a chance to review before execution
     debug_print("Displaying final commands to user")
-    print("\n📋 Final command(s) to execute:")
-    print("----------------------------------------")
-    for i, cmd in enumerate(commands, 1):
-        print(cmd)
-        debug_print(f"  Command {i}: {cmd[:100]}{'...' if len(cmd) > 100 else ''}")
-    print("----------------------------------------")
+    # Header, one newline-joined block of commands, footer: three writes total
+    sys.stdout.write(_FINAL_COMMANDS_HEADER)
+    sys.stdout.write("\n".join(commands) + "\n")
+    sys.stdout.write(_FINAL_COMMANDS_FOOTER)
+    debug_print(f"Displayed {len(commands)} commands")
 
     # Prompt for confirmation
     # Attempts to use stdin for interactive confirmation
@@ -339,18 +501,15 @@ def main() -> None:
         return
     debug_print("User confirmed execution, proceeding to run commands")
 
-    # Execute commands one by one
-    # For each command in the list:
+    # Execute commands
+    # Independent curl calls run concurrently (total time ~ slowest request);
+    # --sequential restores one-at-a-time execution. For each command:
     #   1. Parse command into arguments (platform-specific)
     #   2. Execute via subprocess
     #   3. Capture stdout and stderr
     #   4. Pretty-print JSON if detected in output
-    #   5. Display results with appropriate colors
+    #   5. Display results in order with appropriate colors
     #   6. Check exit code and display error if non-zero
-    debug_print(f"Executing {len(commands)} command(s)...")
-    for i, cmd in enumerate(commands, 1):
-        debug_print(f"Executing command {i}/{len(commands)}")
-        run_command(cmd)
-        debug_print(f"Command {i}/{len(commands)} execution complete")
+    debug_print(f"Executing {len(commands)} command(s) (sequential={args.sequential})...")
+    run_commands(commands, sequential=args.sequential)
     debug_print("All commands executed successfully")
-
@@ -6,6 +6,7 @@ This module handles:
     - format_json_with_jq(): Format JSON in curl commands using jq
     - validate_command(): Validate curl command syntax
     - run_command(): Execute curl commands and display results
+    - run_commands(): Execute several commands (in parallel by default)
 
 Functions:
     extract_commands(tmpfile: str) -> List[str]
@@ -19,32 +20,37 @@ Functions:
         
     run_command(command: str) -> None
         Execute curl command and display output
+        
+    run_commands(commands: List[str], *, sequential: bool = False) -> None
+        Execute commands concurrently and display results in order
 
 Flow:
     1. extract_commands() reads template file and extracts curl commands
     2. format_json_with_jq() formats any JSON in commands (optional)
     3. validate_command() checks each command is valid
-    4. run_command() executes each command and displays results
+    4. run_commands() executes the commands (via run_command() when sequential)
 """
 
-import json
+import functools
 import os
 import re
 import shlex
 import shutil
 import subprocess
-from typing import List
+import sys
+from typing import List, Optional, Tuple
 
-from curlpad.constants import Colors
+from curlpad.constants import IS_WINDOWS, Colors
 from curlpad.dependencies import check_command
 from curlpad.output import print_error, print_warning
+from curlpad import utils
 from curlpad.utils import debug_print
 
-_ALLOWED_CMDS = {"curl", "curl.exe"}  # Support both Unix and Windows
+_ALLOWED_CMDS = frozenset({"curl", "curl.exe"})  # Support both Unix and Windows
 # Blocklist for known dangerous flags
-_BLOCKED_FLAGS = {"--exec", "-e", "--eval", "-K", "--config", "--write-out", "-w"}
+_BLOCKED_FLAGS = frozenset({"--exec", "-e", "--eval", "-K", "--config", "--write-out", "-w"})
 # Allowlist: Only permit known-safe flags (security-first approach)
-_ALLOWED_FLAGS = {
+_ALLOWED_FLAGS = frozenset({
     "-X", "GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS",
     "-H", "--header", "-d", "--data", "--data-raw", "--data-binary", "--data-urlencode",
     "--url", "-i", "--include", "-v", "--verbose", "-s", "--silent", "-S", "--show-error",
@@ -65,9 +71,95 @@ _ALLOWED_FLAGS = {
     "--keepalive-time", "--no-alpn", "--no-npn",
     "--http1.0", "--http1.1", "--http2", "--http2-prior-knowledge",
     "-0", "--http1.0"
-}
+})
+# Flags that send the response body to a file: nothing to capture or pretty-print,
+# so curl inherits the terminal and streams output (and progress meter) directly
+_FILE_OUTPUT_FLAGS = frozenset({"-o", "--output", "-O", "--remote-name"})
+# Upper bound on curl commands run concurrently by run_commands()
+_MAX_PARALLEL_COMMANDS = 8
+# Responses larger than this (in bytes) are printed raw without JSON parsing
+_MAX_PRETTY_BYTES = 1024 * 1024
+# Pretty-printed JSON is written to stdout in blocks of about this many characters
+_PRETTY_WRITE_CHUNK = 64 * 1024
+# Bytes requested per os.read() when streaming curl's pipes
+_STREAM_READ_SIZE = 64 * 1024
+# Response Content-Type as printed by curl -v ("< Content-Type: text/html; ...")
+# Lets _display_result() skip the JSON parse for bodies the server says are not JSON
+_CONTENT_TYPE_RE = re.compile(rb'(?im)^<\s*content-type:\s*([^\r\n;]+)')
 # Dangerous shell metacharacters to block in entire command
-_DANGEROUS_PATTERNS = ['&&', '||', ';', '|', '$', '`', '$(', '${', '>', '<', '\n', '\r']
+_DANGEROUS_PATTERNS = ('&&', '||', ';', '|', '$', '`', '$(', '${', '>', '<', '\n', '\r')
+# All of _DANGEROUS_PATTERNS as one alternation: validate_command() does a single
+# C-level scan of the command instead of one substring search per pattern
+_DANGEROUS_RE = re.compile('|'.join(map(re.escape, _DANGEROUS_PATTERNS)))
+# Shell metacharacters also rejected inside individual (non-flag) arguments
+_ARG_METACHARS = ('`', '$(', '${')
+# JSON payload in a curl data flag, compiled once at import instead of per command
+# Anchored on the flag (no leading .*curl.* scan): group(1) is the quote, group(2) the JSON
+# object or array; the closing quote must match the opening one (backreference \1)
+# Flags: -d, --data, --data-raw, --data-binary (never --data-urlencode: its value is encoded)
+# Example: curl -X POST "url" -d '{"key":"value"}' -> group(2) is {"key":"value"}
+_JSON_IN_D_RE = re.compile(r'(?:-d|--data(?:-raw|-binary)?)\s*([\'"])(\{[^}]*\}|\[[^\]]*\])\1')
+# Whitespace outside JSON strings, for _compact_json(); group(1) is a whole string
+# literal (kept as written), otherwise the match is a whitespace run (dropped)
+_JSON_WS_RE = re.compile(r'("(?:[^"\\]|\\.)*")|[ \t\n\r]+')
+# Long data flags accepted by _extract_json_payload(), as the text following '-d'
+# Longest first so 'ata' does not shadow 'ata-raw'/'ata-binary'
+_DATA_FLAG_SUFFIXES = ('ata-binary', 'ata-raw', 'ata')
+# Colorized output labels, built once at import (constants.Colors is final by then)
+_STDOUT_LABEL = f"{Colors.GREEN}STDOUT:{Colors.RESET}"
+_STDERR_LABEL = f"{Colors.RED}STDERR:{Colors.RESET}"
+_RUNNING_LABEL = f"\n{Colors.CYAN}▶ Running your cURL command...{Colors.RESET}"
+# Line classification bits returned by _classify_line() for extract_commands()
+_LINE_BACKSLASH = 1  # Last non-space char is '\' (backslash continuation)
+_LINE_DASH = 2       # First non-space char is '-' (curl option continuation)
+_LINE_INDENTED = 4   # Line starts with whitespace (indented continuation)
+_LINE_CURL = 8       # Line starts with 'curl' after leading whitespace
+
+
+def _classify_line(line: str, content: str) -> int:
+    """
+    Classify a kept template line for command coalescing.
+
+    Works on the two strings extract_commands() already holds for the line,
+    so classification itself allocates nothing.
+
+    Args:
+        line: Non-blank, non-comment line with trailing whitespace removed
+        content: line with leading whitespace removed as well
+
+    Returns:
+        Bitwise OR of the _LINE_* flags that apply to the line
+    """
+    flags = 0
+    if content.endswith('\\'):
+        flags |= _LINE_BACKSLASH
+    if content.startswith('curl'):
+        flags |= _LINE_CURL
+    elif content.startswith('-'):
+        flags |= _LINE_DASH
+    # Leading whitespace was stripped iff content is shorter than line
+    if len(content) != len(line):
+        flags |= _LINE_INDENTED
+    return flags
+
+
+def _strip_backslash(content: str) -> str:
+    """
+    Drop the trailing continuation backslash from a _LINE_BACKSLASH line.
+
+    The line is already right-stripped, so the backslash is the last char;
+    the remainder only needs another rstrip() when whitespace preceded it.
+
+    Args:
+        content: Line content ending in '\\'
+
+    Returns:
+        content without the backslash and any whitespace before it
+    """
+    content = content[:-1]
+    if content and content[-1].isspace():
+        content = content.rstrip()
+    return content
 
 
 def extract_commands(tmpfile: str) -> List[str]:
@@ -98,50 +190,24 @@ def extract_commands(tmpfile: str) -> List[str]:
         6. Join continuation lines with single spaces
         
     Flow:
-        1. Read all lines from template file
-        2. Filter out comments and empty lines
+        1. Stream lines from template file (single pass, no intermediate lists)
+        2. Skip comments and empty lines while reading
         3. Identify command starts (lines starting with 'curl')
         4. Collect continuation lines
         5. Join lines into complete commands
         6. Return list of commands
     """
     debug_print(f"Extracting commands from template file: {tmpfile}")
+    # debug: Snapshot of utils.DEBUG; per-line messages are only built when it is set
+    # (skips f-string formatting and the debug_print call in the common case)
+    debug = utils.DEBUG
     
-    # raw_lines: List of all lines from the template file (preserving original format)
-    # Each line is stripped of trailing newline but preserves leading whitespace
-    raw_lines: List[str] = []
-    try:
-        with open(tmpfile, 'r') as f:
-            for raw in f:
-                raw_lines.append(raw.rstrip('\n'))
-        debug_print(f"Read {len(raw_lines)} lines from template file")
-    except OSError as e:
-        debug_print(f"Failed to read temp file {tmpfile}: {e}")
-        print_error(f"Failed to read temp file: {e}")
-
-    # Filter out comments and empty lines, but preserve indentation for continuation detection
-    # filtered: List of non-comment, non-empty lines with original indentation preserved
-    # This is important for detecting continuation lines (indented lines continue previous command)
-    filtered: List[str] = []
-    comments_count = 0
-    empty_count = 0
-    for raw in raw_lines:
-        if not raw.strip():  # Skip empty lines
-            empty_count += 1
-            continue
-        if raw.lstrip().startswith('#'):  # Skip comment lines (starting with #)
-            comments_count += 1
-            continue
-        filtered.append(raw)  # Keep line with original indentation
-    
-    debug_print(f"Filtered {len(filtered)} non-comment lines (skipped {comments_count} comments, {empty_count} empty lines)")
-
     # coalesced: Final list of complete curl commands (one command per string)
     # Each command is a single string with all continuation lines joined
     coalesced: List[str] = []
     
-    # current: List of lines that form the current command being built
-    # Lines are collected here until the command is complete, then joined and added to coalesced
+    # current: Stripped, non-empty parts of the command being built
+    # Parts are collected here until the command is complete, then joined and added to coalesced
     current: List[str] = []
 
     def flush_current():
@@ -153,177 +219,416 @@ def extract_commands(tmpfile: str) -> List[str]:
         Then it clears 'current' to start building the next command.
         
         Flow:
-        1. Check if current has any lines
-        2. Join all lines with single spaces (stripping each part)
-        3. If joined string is not empty, add to coalesced
+        1. Check if current has any parts
+        2. Join all parts with single spaces (parts are stripped when appended)
+        3. Add the joined command to coalesced
         4. Clear current list for next command
         """
-        nonlocal current
         if current:
-            # Join with single spaces
-            # Each part is stripped of whitespace, then joined with single space
-            # This handles cases where lines have extra whitespace
-            joined = ' '.join(part.strip() for part in current if part.strip())
-            if joined:
-                coalesced.append(joined)
-        current = []
-
-    # Process each filtered line to extract curl commands
+            coalesced.append(' '.join(current))
+            # clear() in place: the closure keeps one list, no nonlocal rebinding
+            current.clear()
+
+    def append_part(part: str):
+        """Append a stripped command part, dropping parts left empty (e.g. a lone backslash)."""
+        if part:
+            current.append(part)
+
+    # Single pass: filter and coalesce while streaming the template file
+    # (no intermediate raw_lines or filtered lists)
+    line_count = 0
+    kept_count = 0
+    comments_count = 0
+    empty_count = 0
     command_count = 0
-    for raw in filtered:
-        # line: Line with trailing whitespace removed
-        # lstrip: Line with leading whitespace removed (used for checking if line starts with 'curl' or '-')
-        line = raw.rstrip()
-        lstrip = raw.lstrip()
-        
-        # Determine if line is continuation of previous command
-        # is_continuation: True if this line continues the previous command, False if it starts a new command
-        # Continuation is detected if:
-        #   1. Line ends with '\' (backslash continuation)
-        #   2. Line starts with '-' (curl option, continues previous curl command)
-        #   3. Line is indented (multiline format, continues previous command)
-        is_continuation = False
-        if current:  # If we're building a command
-            if line.endswith('\\'):
-                is_continuation = True
-                line = line[:-1].rstrip()  # Remove trailing backslash
-                debug_print(f"Detected backslash continuation on line: {raw[:80]}")
-            elif lstrip.startswith('-'):  # Line starts with curl option
-                is_continuation = True
-                debug_print(f"Detected option continuation on line: {raw[:80]}")
-            elif raw != lstrip:  # Line is indented (has leading whitespace)
-                is_continuation = True
-                debug_print(f"Detected indented continuation on line: {raw[:80]}")
-
-        if not current:
-            # Start new command only when 'curl' begins the line (ignoring leading spaces)
-            if lstrip.startswith('curl'):
-                command_count += 1
-                debug_print(f"Starting new curl command #{command_count}: {line[:80]}")
-                # Handle trailing backslash on curl line
-                if line.endswith('\\'):
-                    current.append(line[:-1].rstrip())  # Add line without backslash
-                    debug_print(f"Command continues on next line (backslash detected)")
+    try:
+        # Text mode decodes in C while iterating (much cheaper than a regex plus
+        # a decode() per line); newline='\n' splits lines exactly where binary mode would
+        with open(tmpfile, 'r', encoding='utf-8', newline='\n') as f:
+            for raw in f:
+                line_count += 1
+                # line: Line with line ending and trailing whitespace removed
+                # Leading whitespace is preserved to detect indented continuation lines
+                line = raw.rstrip()
+                if not line:  # Empty or whitespace-only line
+                    empty_count += 1
+                    continue
+                # content: line without its indent; this is what gets joined into the command
+                content = line.lstrip()
+                if content[0] == '#':  # Comment line (first non-blank char is #)
+                    comments_count += 1
+                    continue
+                kept_count += 1
+                # flags: _LINE_* bits for this line (see _classify_line)
+                flags = _classify_line(line, content)
+                
+                # Determine if line is continuation of previous command
+                # is_continuation: True if this line continues the previous command, False if it starts a new command
+                # Continuation is detected if:
+                #   1. Line ends with '\' (backslash continuation)
+                #   2. Line starts with '-' (curl option, continues previous curl command)
+                #   3. Line is indented (multiline format, continues previous command)
+                is_continuation = False
+                if current:  # If we're building a command
+                    if flags & _LINE_BACKSLASH:
+                        is_continuation = True
+                        content = _strip_backslash(content)  # Remove trailing backslash
+                        if debug:
+                            debug_print(f"Detected backslash continuation on line: {line[:80]}")
+                    elif flags & _LINE_DASH:  # Line starts with curl option
+                        is_continuation = True
+                        if debug:
+                            debug_print(f"Detected option continuation on line: {line[:80]}")
+                    elif flags & _LINE_INDENTED:  # Line is indented (has leading whitespace)
+                        is_continuation = True
+                        if debug:
+                            debug_print(f"Detected indented continuation on line: {line[:80]}")
+
+                if not current:
+                    # Start new command only when 'curl' begins the line (ignoring leading spaces)
+                    if flags & _LINE_CURL:
+                        command_count += 1
+                        if debug:
+                            debug_print(f"Starting new curl command #{command_count}: {line[:80]}")
+                        # Handle trailing backslash on curl line
+                        if flags & _LINE_BACKSLASH:
+                            append_part(_strip_backslash(content))  # Add line without backslash
+                            if debug:
+                                debug_print(f"Command continues on next line (backslash detected)")
+                        else:
+                            append_part(content)  # Add complete single-line command
+                            flush_current()  # Command is complete, flush it
+                    else:
+                        if debug:
+                            debug_print(f"Skipping non-curl leading line: {line[:80]}")
                 else:
-                    current.append(line)  # Add complete single-line command
-                    flush_current()  # Command is complete, flush it
-            else:
-                debug_print(f"Skipping non-curl leading line: {raw[:80]}")
-        else:
-            # Continuation for existing curl command
-            current.append(line)  # Add line to current command
-            debug_print(f"Adding continuation line to command: {line[:80]}")
-            if not is_continuation:  # If this line doesn't continue, command is complete
-                flush_current()  # Flush current command and start new one
+                    # Continuation for existing curl command
+                    append_part(content)  # Add line to current command
+                    if debug:
+                        debug_print(f"Adding continuation line to command: {content[:80]}")
+                    if not is_continuation:  # If this line doesn't continue, command is complete
+                        flush_current()  # Flush current command and start new one
+        debug_print(f"Read {line_count} lines from template file")
+    except (OSError, UnicodeDecodeError) as e:
+        debug_print(f"Failed to read temp file {tmpfile}: {e}")
+        print_error(f"Failed to read temp file: {e}")
+    
+    debug_print(f"Kept {kept_count} non-comment lines (skipped {comments_count} comments, {empty_count} empty lines)")
 
     # Flush at end to handle last command (in case file doesn't end with newline)
     flush_current()
 
     debug_print(f"Extracted {len(coalesced)} curl command(s) from {tmpfile}")
-    for i, cmd in enumerate(coalesced, 1):
-        debug_print(f"  Command {i}: {cmd[:100]}{'...' if len(cmd) > 100 else ''}")
+    if debug:
+        for i, cmd in enumerate(coalesced, 1):
+            debug_print(f"  Command {i}: {cmd[:100]}{'...' if len(cmd) > 100 else ''}")
     return coalesced
 
 
+def _extract_json_payload(line: str) -> Optional[Tuple[int, int]]:
+    """
+    Locate a JSON payload passed to a curl data flag with a single linear scan.
+
+    Walks each '-d' occurrence (including the long --data, --data-raw and
+    --data-binary spellings): skips whitespace, expects an opening quote,
+    then tracks bracket depth and JSON string/escape state until the object
+    or array closes. Unlike the regex, this handles nesting and never
+    backtracks.
+
+    Args:
+        line: Curl command string to scan
+
+    Returns:
+        (start, end) slice indices of the JSON payload in line, or None if
+        no quoted JSON object/array follows a data flag
+
+    Flow:
+        1. Find next '-d', resolve long flag spellings, skip whitespace,
+           read the opening quote
+        2. Require '{' or '[' and walk characters tracking depth, in_str, esc
+        3. On depth 0, accept if the next char is the matching quote
+        4. Otherwise continue with the next '-d' occurrence
+    """
+    n = len(line)
+    pos = line.find('-d')
+    while pos != -1:
+        i = pos + 2
+        if pos > 0 and line[pos - 1] == '-':
+            # Long flag (--d...): only the data spellings whose value is sent verbatim
+            for suffix in _DATA_FLAG_SUFFIXES:
+                if line.startswith(suffix, i):
+                    i += len(suffix)
+                    break
+            else:
+                i = -1
+            if i != -1 and i < n and line[i] not in ' \t\'"':
+                # e.g. --data-urlencode, --data-ascii, --dump-header
+                i = -1
+            if i == -1:
+                pos = line.find('-d', pos + 2)
+                continue
+        while i < n and line[i] in ' \t':
+            i += 1
+        if i + 1 < n and line[i] in '\'"' and line[i + 1] in '{[':
+            quote = line[i]
+            start = i + 1
+            depth = 0
+            in_str = False
+            esc = False
+            j = start
+            while j < n:
+                ch = line[j]
+                if esc:
+                    esc = False
+                elif in_str:
+                    if ch == '\\':
+                        esc = True
+                    elif ch == '"':
+                        in_str = False
+                elif ch == '"':
+                    in_str = True
+                elif ch in '{[':
+                    depth += 1
+                elif ch in '}]':
+                    depth -= 1
+                    if depth == 0:
+                        break
+                j += 1
+            end = j + 1
+            if j < n and end < n and line[end] == quote:
+                return start, end
+        pos = line.find('-d', pos + 2)
+    return None
+
+
+def _compact_json(src: str) -> Optional[str]:
+    """
+    Compact a JSON document in-process, without a jq subprocess.
+
+    The document is only validated with json.loads (C-accelerated _json);
+    the compacted text is the input with insignificant whitespace removed,
+    so number and string tokens reach the server exactly as written
+    (1e5 and 1.10 stay 1e5 and 1.10, escapes are not rewritten).
+
+    Args:
+        src: JSON text (object or array) to compact
+
+    Returns:
+        Compacted JSON string, or None if json cannot parse it or it holds
+        NaN/Infinity, so the caller can fall back to jq
+
+    Flow:
+        1. Validate with json.loads(), rejecting the NaN/Infinity/-Infinity literals
+        2. Drop whitespace outside string literals (_JSON_WS_RE)
+    """
+    # Imported lazily: only commands carrying a JSON payload need the json module
+    import json
+    try:
+        json.loads(src, parse_constant=_reject_json_constant)
+    except (ValueError, RecursionError):  # JSONDecodeError subclasses ValueError
+        return None
+    # String literals are substituted back unchanged; whitespace runs become '' (group 1 unset)
+    return _JSON_WS_RE.sub(r'\1', src)
+
+
+def _reject_json_constant(name: str) -> None:
+    """
+    json.loads() parse_constant hook: refuse NaN, Infinity and -Infinity.
+
+    These are not valid JSON (json.loads accepts them by default), so a
+    payload holding them is left to jq.
+
+    Raises:
+        ValueError: Always
+    """
+    raise ValueError(f"non-standard JSON constant: {name}")
+
+
+def _format_pending_with_jq(formatted_commands: List[str],
+                            pending: List[Tuple[int, str, str, str]]) -> None:
+    """
+    Compact queued JSON payloads with a single jq process (in place).
+
+    Every payload is written to jq's stdin as one raw line. jq parses each
+    line independently, so a malformed payload yields "null" for that
+    line only instead of aborting the whole batch.
+
+    Args:
+        formatted_commands: Command list being built by format_json_with_jq()
+                            Entries at the queued indexes are replaced on success
+        pending: (index, before, json_str, after) tuples to format
+
+    Flow:
+        1. Join all payloads with newlines and run jq once
+        2. Map output lines back to their commands by position
+        3. Replace commands whose payload jq could parse; keep the rest
+    """
+    debug_print(f"Running jq once for {len(pending)} queued JSON payload(s)")
+    try:
+        # jq -cR: Read each input line as a raw string, print compact output
+        # 'try fromjson catch null': Parse each line, null on invalid JSON
+        # Payloads always start with '{', so null never collides with real output
+        result = subprocess.run(
+            ['jq', '-cR', 'try fromjson catch null'],
+            input=''.join(item[2] + '\n' for item in pending),
+            text=True,
+            capture_output=True,
+            check=True
+        )
+    except subprocess.CalledProcessError as e:
+        # If jq fails outright, keep every original command
+        debug_print(f"jq failed to format JSON (returncode={e.returncode}): {e.stderr[:100] if e.stderr else 'no stderr'}")
+        debug_print("Keeping original command lines")
+        return
+
+    outputs = result.stdout.splitlines()
+    debug_print(f"jq completed: returncode={result.returncode}, {len(outputs)} line(s) returned")
+    if len(outputs) != len(pending):
+        debug_print("jq output does not line up with queued payloads; keeping original command lines")
+        return
+
+    for (index, before, json_str, after), formatted_json in zip(pending, outputs):
+        if formatted_json == 'null':
+            debug_print(f"jq could not parse JSON in command {index + 1}; keeping original line")
+            continue
+        debug_print(f"Formatted JSON: {formatted_json[:50]}{'...' if len(formatted_json) > 50 else ''}")
+        formatted_commands[index] = f"{before}{formatted_json}{after}"
+        debug_print(f"Formatted JSON in command {index + 1} via jq")
+
+
 def format_json_with_jq(commands: List[str]) -> List[str]:
     """
     Format JSON in curl commands using jq if available.
     
-    Attempts to format JSON strings in curl commands using jq.
-    If jq is not available or formatting fails, returns original commands.
+    Attempts to compact JSON strings in curl commands, in-process first
+    (_compact_json, whitespace only) and via jq for payloads json rejects.
+    If formatting fails (or jq is needed but not installed), the original
+    command is kept.
     
     Args:
         commands: List of curl command strings
         
     Returns:
-        List of commands with JSON formatted (if jq available)
+        List of commands with JSON formatted
         
     Flow:
-        1. Check if jq is available
-        2. For each command, search for JSON in -d flag
-        3. Extract JSON string and format with jq
-        4. Replace original JSON with formatted version
+        1. For each command, search for JSON in -d flag
+        2. Extract JSON string and compact it (in-process, jq as fallback)
+        3. Replace original JSON with formatted version
+        4. If jq is available, send payloads json rejected through one jq process
         5. Return formatted commands
     """
     debug_print(f"Formatting JSON in {len(commands)} command(s) using jq")
-    
-    if not check_command('jq'):
-        debug_print("jq not found; skipping JSON formatting")
-        return commands
+    # debug: Snapshot of utils.DEBUG; per-command messages are only built when it is set
+    debug = utils.DEBUG
 
-    debug_print("jq found, attempting to format JSON in commands")
+    # Global fast path: no command carries a -d flag, so there is nothing to format
+    # Skips the per-command loop entirely
+    if not any('-d' in cmd for cmd in commands):
+        debug_print("No -d flag in any command; skipping JSON formatting")
+        return commands
 
-    # formatted_commands: List of commands with JSON formatted (if jq available)
+    # formatted_commands: List of commands with JSON formatted
     # Starts as empty list, commands are added one by one
     # Each command is either formatted (if JSON found) or original (if no JSON or jq fails)
     formatted_commands = []
+    # jq_pending: (index, before, json_str, after) for payloads json could not parse
+    # Formatted together by one jq process instead of one subprocess per command
+    jq_pending: List[Tuple[int, str, str, str]] = []
 
     # Process each command to format JSON if present
     for i, line in enumerate(commands, 1):
-        debug_print(f"Processing command {i}/{len(commands)} for JSON formatting")
+        if debug:
+            debug_print(f"Processing command {i}/{len(commands)} for JSON formatting")
         # original_line: Original command string before formatting
         # Kept for comparison and debug output
         original_line = line
-        
-        # Look for curl commands with -d containing JSON
-        # pattern: Regular expression to match JSON in curl -d flag
-        # Matches: (before -d flag)(JSON object)(after JSON)
-        # Example: curl -X POST "url" -d '{"key":"value"}' -> matches '{"key":"value"}'
-        pattern = r'(.*curl.*-d\s*[\'"])({[^}]*})([\'"].*)'
-        match = re.search(pattern, line)
-
-        if match:
-            debug_print(f"Found JSON in command {i}, attempting to format")
-            # match: Regex match object if JSON found in command
-            # before: Part of command before JSON (curl command and -d flag)
-            # json_str: JSON string extracted from command
-            # after: Part of command after JSON (closing quote and rest of command)
-            before, json_str, after = match.groups()
-            try:
+
+        # Fast path: skip the regex entirely when there is no -d flag to match
+        if '-d' not in line:
+            if debug:
+                debug_print(f"No -d flag in command {i}, skipping JSON search")
+            formatted_commands.append(line)
+            continue
+
+        # Look for a JSON object passed to -d
+        # _extract_json_payload() does a linear brace scan (handles nested objects)
+        # _JSON_IN_D_RE is kept as a fallback for shapes the scanner rejects
+        # before: Part of command before JSON (curl command and -d flag)
+        # json_str: JSON string extracted from command
+        # after: Part of command after JSON (closing quote and rest of command)
+        match = None
+        span = _extract_json_payload(line)
+        if span is not None:
+            before, json_str, after = line[:span[0]], line[span[0]:span[1]], line[span[1]:]
+        else:
+            match = _JSON_IN_D_RE.search(line)
+            if match:
+                # Slice around the JSON group instead of capturing before/after
+                before, json_str, after = line[:match.start(2)], match.group(2), line[match.end(2):]
+
+        if span is not None or match:
+            if debug:
+                debug_print(f"Found JSON in command {i}, attempting to format")
                 debug_print(f"Extracted JSON string: {json_str[:50]}{'...' if len(json_str) > 50 else ''}")
-                # Format JSON using jq
-                # result: CompletedProcess from jq subprocess
-                # jq -c '.': Format JSON in compact mode (single line)
-                # input=json_str: Pass JSON string to jq via stdin
-                # text=True: Return output as string (not bytes)
-                # capture_output=True: Capture stdout and stderr
-                # check=True: Raise exception if jq fails
-                debug_print(f"Running jq to format JSON: jq -c .")
-                result = subprocess.run(
-                    ['jq', '-c', '.'],
-                    input=json_str,
-                    text=True,
-                    capture_output=True,
-                    check=True
-                )
-                debug_print(f"jq completed: returncode={result.returncode}, stdout_len={len(result.stdout)}")
-                # formatted_json: JSON string formatted by jq (compact format)
-                # result.stdout.strip(): Remove trailing newline from jq output
-                formatted_json = result.stdout.strip()
-                debug_print(f"Formatted JSON: {formatted_json[:50]}{'...' if len(formatted_json) > 50 else ''}")
+            # formatted_json: Compact JSON string, or None if formatting failed
+            # Fast path: compact in-process with _compact_json() (whitespace only, no subprocess)
+            # Fallback: jq for payloads json cannot parse
+            formatted_json = _compact_json(json_str)
+            if formatted_json is not None:
+                if debug:
+                    debug_print("Compacted JSON in-process (jq not needed)")
+                    debug_print(f"Formatted JSON: {formatted_json[:50]}{'...' if len(formatted_json) > 50 else ''}")
                 # line: Reconstructed command with formatted JSON
                 # Combines before, formatted_json, and after parts
                 line = f"{before}{formatted_json}{after}"
-                debug_print(f"Formatted JSON in command {i}: {original_line[:80]}... -> {line[:80]}...")
-            except subprocess.CalledProcessError as e:
-                # If jq fails (command not found or invalid JSON), keep original command
-                debug_print(f"jq failed to format JSON (returncode={e.returncode}): {e.stderr[:100] if e.stderr else 'no stderr'}")
-                debug_print("Keeping original command line")
-                pass
-            except json.JSONDecodeError as e:
-                # JSON was invalid (shouldn't happen, but safe to catch)
-                debug_print(f"JSON decode error: {e}")
-                debug_print("Keeping original command line")
-                pass
+                if debug:
+                    debug_print(f"Formatted JSON in command {i}: {original_line[:80]}... -> {line[:80]}...")
+            elif '\n' not in json_str and '\r' not in json_str:
+                # Defer to jq: queued and sent through a single jq process after the loop
+                # The original line is kept as a placeholder until jq answers
+                if debug:
+                    debug_print(f"Queueing JSON from command {i} for batched jq formatting")
+                jq_pending.append((len(formatted_commands), before, json_str, after))
 
         # Add command to formatted list (either formatted or original)
         formatted_commands.append(line)
-        debug_print(f"Added command {i} to formatted list")
+        if debug:
+            debug_print(f"Added command {i} to formatted list")
+
+    # jq is only looked up when a payload actually needs it
+    if jq_pending:
+        if check_command('jq'):
+            _format_pending_with_jq(formatted_commands, jq_pending)
+        else:
+            debug_print(f"jq not found; keeping {len(jq_pending)} unparsed JSON payload(s) as written")
 
     debug_print(f"JSON formatting complete: {len(formatted_commands)} command(s) processed")
     return formatted_commands
 
 
+@functools.lru_cache(maxsize=128)
+def _split_command(command: str, posix: bool = True) -> Tuple[str, ...]:
+    """
+    Split a command into argv with shlex, once per distinct command.
+
+    shlex is a pure-Python tokenizer, and validate_command() and
+    run_curl_command() need the same tokens, so the result is memoized. A tuple is returned so the shared cached value
+    cannot be mutated by a caller.
+
+    Args:
+        command: Command string to split
+        posix: shlex POSIX mode (False for Windows-style quoting)
+
+    Returns:
+        Tuple of argv tokens
+
+    Raises:
+        ValueError: If quotes are unbalanced (errors are not cached)
+    """
+    return tuple(shlex.split(command, posix=posix))
+
+
 def validate_command(command: str) -> bool:
     """
     Strict allowlist-based validation of curl command syntax.
@@ -331,6 +636,10 @@ def validate_command(command: str) -> bool:
     Performs comprehensive validation to ensure the command is safe and
     looks like a valid curl command.
 
+    Not memoized: every call logs its checks and warnings, so --debug output
+    does not depend on whether the command was seen before. The costly
+    shlex split is still shared through _split_command().
+
     Args:
         command: Curl command string to validate
 
@@ -338,13 +647,17 @@ def validate_command(command: str) -> bool:
         True if command appears valid, False otherwise
 
     Validation Rules:
-        1. Command must start with 'curl' (after stripping whitespace)
+        1. Command must start with 'curl' (after stripping whitespace), checked
+           by a prefix compare before any scanning or parsing
         2. Block multiline commands (newlines, carriage returns)
         3. Block dangerous shell metacharacters (&&, ||, ;, |, $, `, etc.)
         4. Use allowlist for flags - only permit known-safe curl options
         5. Block known dangerous flags (--exec, -K/--config, -w/--write-out)
         6. Use shlex parsing to ensure proper command structure
     """
+    # debug: Snapshot of utils.DEBUG; the per-argument messages below are only
+    # formatted when it is set (failure paths exit right away and stay unguarded)
+    debug = utils.DEBUG
     try:
         cmd = command.strip()
         
@@ -353,40 +666,50 @@ def validate_command(command: str) -> bool:
             debug_print("Validation failed: empty command")
             return False
         
-        # Block multiline commands
-        if '\n' in cmd or '\r' in cmd:
-            debug_print("Validation failed: multiline command detected")
+        # Fast reject before the pattern scans and shlex: the command has to begin with
+        # 'curl' followed by whitespace, '.exe', or nothing (so 'curly ...' fails here)
+        if not cmd.startswith('curl') or cmd[4:5] not in ('', ' ', '\t', '.'):
+            debug_print("Validation failed: command does not start with 'curl'")
             return False
         
-        # Block dangerous shell metacharacters in entire command
-        for pattern in _DANGEROUS_PATTERNS:
-            if pattern in cmd:
-                debug_print(f"Validation failed: dangerous pattern '{pattern}' detected")
-                return False
+        # Block multiline commands and dangerous shell metacharacters in the entire
+        # command with one regex scan (_DANGEROUS_PATTERNS includes '\n' and '\r')
+        dangerous = _DANGEROUS_RE.search(cmd)
+        if dangerous:
+            if dangerous.group() in ('\n', '\r'):
+                debug_print("Validation failed: multiline command detected")
+            else:
+                debug_print(f"Validation failed: dangerous pattern '{dangerous.group()}' detected")
+            return False
         
         # Parse command safely
-        debug_print(f"Parsing command with shlex.split (posix=True)...")
-        parts = shlex.split(cmd, posix=True)
-        debug_print(f"Parsed into {len(parts)} parts: {parts[:5]}{'...' if len(parts) > 5 else ''}")
+        debug_print("Parsing command with shlex.split (posix=True)...")
+        # Shared with run_curl_command() through the _split_command() cache
+        parts = _split_command(cmd, True)
+        if debug:
+            debug_print(f"Parsed into {len(parts)} parts: {parts[:5]}{'...' if len(parts) > 5 else ''}")
         
         # Must start with 'curl' or 'curl.exe'
         if not parts or parts[0] not in _ALLOWED_CMDS:
             debug_print(f"Validation failed: command must start with 'curl' or 'curl.exe', got '{parts[0] if parts else 'empty'}'")
             return False
         
-        debug_print(f"Command starts with '{parts[0]}', validating {len(parts) - 1} argument(s)...")
+        if debug:
+            debug_print(f"Command starts with '{parts[0]}', validating {len(parts) - 1} argument(s)...")
         
         # Validate each argument
         i = 1
         while i < len(parts):
             part = parts[i]
-            debug_print(f"  Validating part {i}/{len(parts)-1}: {part[:50]}{'...' if len(part) > 50 else ''}")
+            if debug:
+                debug_print(f"  Validating part {i}/{len(parts)-1}: {part[:50]}{'...' if len(part) > 50 else ''}")
             
             # Check if it's a flag
             if part.startswith('-'):
                 # Extract flag name (handle -X GET vs --header=value)
                 flag = part.split('=')[0]
-                debug_print(f"    Detected flag: {flag}")
+                if debug:
+                    debug_print(f"    Detected flag: {flag}")
                 
                 # Block explicitly dangerous flags
                 if flag in _BLOCKED_FLAGS:
@@ -397,20 +720,24 @@ def validate_command(command: str) -> bool:
                 if flag not in _ALLOWED_FLAGS:
                     debug_print(f"    Validation failed: unknown/disallowed flag '{flag}' (not in allowlist)")
                     return False
-                debug_print(f"    Flag '{flag}' is allowed")
+                if debug:
+                    debug_print(f"    Flag '{flag}' is allowed")
             else:
                 # Non-flag argument (URL, header value, data, etc.)
-                debug_print(f"    Non-flag argument detected, checking for shell metacharacters...")
+                if debug:
+                    debug_print("    Non-flag argument detected, checking for shell metacharacters...")
                 # Check for shell metacharacters in arguments too
-                for pattern in ['`', '$(', '${']:
+                for pattern in _ARG_METACHARS:
                     if pattern in part:
                         debug_print(f"    Validation failed: shell metacharacter '{pattern}' in argument '{part[:50]}'")
                         return False
-                debug_print(f"    Argument validated: no shell metacharacters")
+                if debug:
+                    debug_print("    Argument validated: no shell metacharacters")
             
             i += 1
         
-        debug_print(f"Validation passed for command: {cmd[:100]}...")
+        if debug:
+            debug_print(f"Validation passed for command: {cmd[:100]}...")
         return True
         
     except (ValueError, AttributeError) as e:
@@ -418,32 +745,147 @@ def validate_command(command: str) -> bool:
         return False
 
 
-def run_curl_command(command: str, *, windows: bool = False):
+@functools.lru_cache(maxsize=None)
+def _resolve_curl(name: str) -> str:
+    """
+    Resolve the curl executable to an absolute path once per process.
+
+    Uses shutil.which() directly, not the on-disk find_command() cache:
+    the binary that is executed must be the first match on the current PATH.
+
+    Args:
+        name: Validated command name ('curl' or 'curl.exe')
+
+    Returns:
+        Absolute path from shutil.which(), or name unchanged if not found
+        (subprocess then reports the missing binary as usual)
+    """
+    path = shutil.which(name)
+    debug_print(f"Resolved '{name}' to: {path or 'not found in PATH'}")
+    return path or name
+
+
+def _stream_curl(parts: List[str], env: dict) -> subprocess.CompletedProcess:
+    """
+    Run curl and forward its stdout to the terminal as it arrives.
+
+    Both pipes are driven with a selector and read with os.read(), so
+    memory stays constant and the first bytes show up as soon as curl
+    receives them (long downloads, server-sent events). A body whose first
+    non-whitespace byte is { or [ is buffered instead, up to
+    _MAX_PRETTY_BYTES, so _display_result() can still pretty-print it;
+    past that limit it is flushed and streamed like any other body.
+    stderr is small and always buffered for display after stdout.
+
+    Args:
+        parts: argv with parts[0] resolved to the curl executable
+        env: Environment for the child process
+
+    Returns:
+        CompletedProcess whose stdout is the buffered JSON body as bytes,
+        or None if the body was already streamed; stderr is bytes
+
+    Raises:
+        OSError: If curl cannot be started
+    """
+    # Imported lazily: only the single-command streaming path needs selectors
+    import selectors
+
+    out = sys.stdout.buffer
+    # body: Buffered stdout while it may still be pretty-printed JSON
+    body = bytearray()
+    err = bytearray()
+    # streaming: True once stdout is being forwarded (header already printed)
+    streaming = False
+    # undecided: True until the first non-whitespace stdout byte is seen
+    undecided = True
+
+    def start_streaming():
+        """Print the STDOUT header and flush whatever was buffered so far."""
+        nonlocal streaming
+        streaming = True
+        print(_STDOUT_LABEL, flush=True)
+        out.write(body)
+        out.flush()
+        body.clear()
+
+    with subprocess.Popen(parts, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env) as proc:
+        with selectors.DefaultSelector() as selector:
+            selector.register(proc.stdout, selectors.EVENT_READ, body)
+            selector.register(proc.stderr, selectors.EVENT_READ, err)
+            while selector.get_map():
+                for key, _ in selector.select():
+                    chunk = os.read(key.fd, _STREAM_READ_SIZE)
+                    if not chunk:
+                        selector.unregister(key.fileobj)
+                        continue
+                    if key.data is err:
+                        err += chunk
+                    elif streaming:
+                        out.write(chunk)
+                        out.flush()
+                    else:
+                        body += chunk
+                        if undecided:
+                            head = body.lstrip()[:1]
+                            if head:
+                                undecided = False
+                                if head not in (b'{', b'['):
+                                    start_streaming()
+                        elif len(body) > _MAX_PRETTY_BYTES:
+                            debug_print(f"Buffered JSON exceeds {_MAX_PRETTY_BYTES} bytes, streaming the rest")
+                            start_streaming()
+        returncode = proc.wait()
+
+    if streaming:
+        # Same trailing newline the captured path prints after the body
+        out.write(b'\n')
+        out.flush()
+        debug_print(f"Streamed curl stdout to the terminal: returncode={returncode}, stderr_len={len(err)}")
+        return subprocess.CompletedProcess(parts, returncode, None, bytes(err))
+    debug_print(f"Buffered curl stdout for display: returncode={returncode}, stdout_len={len(body)}, stderr_len={len(err)}")
+    return subprocess.CompletedProcess(parts, returncode, bytes(body), bytes(err))
+
+
+def run_curl_command(command: str, *, windows: bool = False, stream: bool = False):
     """
     Execute curl command safely with validation.
 
     Args:
         command: Curl command string to execute
         windows: Whether running on Windows (affects parsing)
+        stream: Forward non-JSON stdout to the terminal while curl runs
+                (_stream_curl); ignored on Windows, where pipes cannot be
+                selected, and when stdout has no binary buffer
 
     Returns:
-        subprocess.CompletedProcess object
+        subprocess.CompletedProcess object with stdout/stderr as bytes
+        stdout/stderr are None when output was streamed straight to the terminal
+        (command writes its body to a file via -o/--output/-O/--remote-name);
+        with stream=True, stdout is None when the body was already forwarded
 
     Raises:
         ValueError: If command validation fails
         RuntimeError: If command execution fails
     """
-    debug_print(f"run_curl_command called: windows={windows}, command length={len(command)}")
+    # debug: Snapshot of utils.DEBUG; messages that slice or format the command are guarded
+    debug = utils.DEBUG
+    if debug:
+        debug_print(f"run_curl_command called: windows={windows}, command length={len(command)}")
 
     if not validate_command(command):
-        debug_print(f"Command validation failed, raising ValueError")
+        debug_print("Command validation failed, raising ValueError")
         raise ValueError(f"Invalid curl command: {command!r}")
 
-    debug_print(f"Command validation passed, parsing command")
+    debug_print("Command validation passed, parsing command")
     try:
-        parts = shlex.split(command, posix=not windows)
-        debug_print(f"Parsed command into {len(parts)} arguments: {parts[:5]}{'...' if len(parts) > 5 else ''}")
-        debug_print(f"Executing subprocess.run with shell=False (security: no shell execution)")
+        # Usually a cache hit: validate_command() already split the same string (POSIX mode)
+        parts = list(_split_command(command, not windows))
+        if debug:
+            debug_print(f"Parsed command into {len(parts)} arguments: {parts[:5]}{'...' if len(parts) > 5 else ''}")
+        # Exec curl directly by absolute path (cached, so PATH is scanned only once)
+        parts[0] = _resolve_curl(parts[0])
+        debug_print("Executing subprocess.run with shell=False (security: no shell execution)")
 
         # Prepare environment to avoid OpenSSL library conflicts with PyInstaller
         env = os.environ.copy()
@@ -467,14 +909,194 @@ def run_curl_command(command: str, *, windows: bool = False):
                 debug_print("No _MEI paths found in LD_LIBRARY_PATH")
 
         # Never use shell=True
-        result = subprocess.run(parts, capture_output=True, text=True, check=False, env=env)
-        debug_print(f"Subprocess completed: returncode={result.returncode}, stdout_len={len(result.stdout)}, stderr_len={len(result.stderr)}")
+        if any(part.split('=')[0] in _FILE_OUTPUT_FLAGS for part in parts[1:]):
+            # Body goes to a file: inherit stdout/stderr instead of buffering in memory
+            debug_print("Output flag detected, streaming curl output directly to the terminal")
+            result = subprocess.run(parts, check=False, env=env)
+            debug_print(f"Subprocess completed: returncode={result.returncode} (output streamed)")
+            return result
+
+        if stream and not windows and hasattr(sys.stdout, 'buffer'):
+            debug_print("Streaming curl stdout as it arrives")
+            return _stream_curl(parts, env)
+
+        # Captured as bytes: only JSON responses are ever decoded (see _display_result)
+        result = subprocess.run(parts, capture_output=True, check=False, env=env)
+        if debug:
+            debug_print(f"Subprocess completed: returncode={result.returncode}, stdout_len={len(result.stdout)}, stderr_len={len(result.stderr)}")
         return result
     except (ValueError, OSError) as e:
         debug_print(f"Command execution failed: {type(e).__name__}: {e}")
         raise RuntimeError(f"Command execution failed: {e}") from e
 
 
+def _write_bytes(data: bytes) -> None:
+    """
+    Write raw curl output to stdout followed by a newline, without decoding.
+
+    Goes straight to sys.stdout.buffer (after flushing pending text so the
+    colored headers stay in order). Falls back to a lossy decode when
+    stdout has no binary layer (e.g. replaced by a StringIO).
+
+    Args:
+        data: Bytes captured from curl
+    """
+    buffer = getattr(sys.stdout, 'buffer', None)
+    if buffer is None:
+        sys.stdout.write(data.decode('utf-8', errors='replace') + '\n')
+        return
+    sys.stdout.flush()
+    buffer.write(data)
+    buffer.write(b'\n')
+    buffer.flush()
+
+
+def _write_json_pretty(data) -> None:
+    """
+    Write parsed JSON to stdout with 2-space indentation, streaming.
+
+    The encoder's chunks are written in blocks of _PRETTY_WRITE_CHUNK
+    characters, so the fully formatted string is never built (peak memory
+    is the raw response plus the parsed object), and a line-buffered
+    terminal sees a few large writes instead of one per output line.
+
+    Args:
+        data: Parsed JSON object (dict or list)
+    """
+    # Imported lazily: only JSON-looking responses need the json module
+    import json
+    # ensure_ascii=False: Allow Unicode characters in output
+    encoder = json.JSONEncoder(indent=2, ensure_ascii=False)
+    write = sys.stdout.write
+    buf: List[str] = []
+    size = 0
+    for chunk in encoder.iterencode(data):
+        buf.append(chunk)
+        size += len(chunk)
+        if size >= _PRETTY_WRITE_CHUNK:
+            write(''.join(buf))
+            buf.clear()
+            size = 0
+    buf.append('\n')
+    write(''.join(buf))
+
+
+def _may_be_json_type(stderr: Optional[bytes]) -> bool:
+    """
+    Check curl's verbose output for a Content-Type that rules out JSON.
+
+    Only curl -v prints response headers to stderr. When none are present
+    (the usual -s case) the body sniffing in _display_result() decides.
+
+    Args:
+        stderr: Raw stderr bytes from curl, or None
+
+    Returns:
+        False if the last reported Content-Type does not mention json
+        (redirects print one per hop; the final response comes last),
+        True otherwise
+    """
+    if not stderr:
+        return True
+    types = _CONTENT_TYPE_RE.findall(stderr)
+    if not types:
+        return True
+    debug_print(f"Response Content-Type from curl -v: {types[-1].strip()!r}")
+    return b'json' in types[-1].lower()
+
+
+def _display_result(result: subprocess.CompletedProcess, fatal: bool = True) -> bool:
+    """
+    Display the output of an executed curl command.
+
+    Args:
+        result: CompletedProcess returned by run_curl_command()
+                stdout/stderr are bytes, or None when output was streamed to the terminal
+        fatal: Exit on a non-zero exit code (default); if False the error
+               is printed and False is returned instead
+
+    Returns:
+        True if the command exited with code 0, False otherwise (only when not fatal)
+
+    Raises:
+        SystemExit: If the command exited with a non-zero code and fatal is True
+
+    Flow:
+        1. Pretty-print JSON in stdout if detected (the only decode), otherwise
+           write the raw bytes
+        2. Print stderr in red (raw bytes)
+        3. Check exit code and display error if non-zero
+    """
+    # Print stdout (standard output from curl command)
+    if result.stdout:
+        debug_print(f"STDOUT received: {len(result.stdout)} bytes")
+        print(_STDOUT_LABEL)
+        # out: Raw stdout bytes; never copied with strip() or decoded up front
+        # (json.loads accepts bytes and skips the surrounding whitespace)
+        out = result.stdout
+        
+        # Try to pretty-print JSON if applicable
+        # pretty_printed: Flag indicating if JSON was detected and formatted
+        # If True, JSON was found and pretty-printed; if False, output is printed as-is
+        pretty_printed = False
+        # first/last: First and last non-whitespace characters, found on short
+        # slices so the check does not copy the whole response
+        # (falls back to a full strip only for 64+ characters of padding)
+        first = out[:64].lstrip()[:1] or out.lstrip()[:1]
+        last = out[-64:].rstrip()[-1:] or out.rstrip()[-1:]
+        if first:
+            if utils.DEBUG:
+                debug_print(f"Checking if STDOUT is JSON (first 50 bytes: {out.lstrip()[:50]!r})")
+            # Fast-path: Check if output starts with { or [ and ends with } or ]
+            if len(out) > _MAX_PRETTY_BYTES:
+                # Too large to be worth a full parse; print raw
+                debug_print(f"STDOUT exceeds {_MAX_PRETTY_BYTES} bytes, skipping JSON pretty-print")
+            elif not _may_be_json_type(result.stderr):
+                debug_print("Response Content-Type is not JSON, skipping JSON pretty-print")
+            elif (first == b'{' and last == b'}') or (first == b'[' and last == b']'):
+                debug_print("STDOUT looks like JSON, attempting to parse")
+                # Imported lazily: only JSON-looking responses need the json module
+                import json
+                try:
+                    # data: Parsed JSON object (dict or list), decoded from UTF-8 by json.loads
+                    data = json.loads(out)
+                    debug_print(f"JSON parsed successfully: type={type(data).__name__}")
+                    # Streamed to stdout (no full formatted string in memory)
+                    _write_json_pretty(data)
+                    pretty_printed = True
+                    debug_print("Pretty-printed JSON response")
+                except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                    # If JSON parsing fails, output didn't contain valid JSON
+                    debug_print(f"STDOUT looked like JSON but failed to parse: {e}")
+                    debug_print("Printing raw output instead")
+        if not pretty_printed:
+            # If JSON not detected or parsing failed, print output as-is
+            debug_print("Printing STDOUT as raw text (not JSON)")
+            _write_bytes(result.stdout)
+    else:
+        debug_print("No STDOUT received from command")
+
+    # Print stderr (error output from curl command)
+    # stderr typically contains warnings, errors, or verbose output
+    if result.stderr:
+        debug_print(f"STDERR received: {len(result.stderr)} bytes")
+        print(_STDERR_LABEL)
+        _write_bytes(result.stderr)
+    else:
+        debug_print("No STDERR received from command")
+
+    # Check exit code
+    # result.returncode: Exit code from curl command
+    # 0 = success, non-zero = error
+    debug_print(f"Process exited with code: {result.returncode}")
+    if result.returncode != 0:
+        debug_print(f"Command failed with non-zero exit code: {result.returncode}")
+        print_error(f"cURL execution failed with exit code {result.returncode}", fatal=fatal)
+        return False
+    debug_print("Command executed successfully (exit code 0)")
+    return True
+
+
 def run_command(command: str) -> None:
     """
     Execute curl command and display output.
@@ -490,12 +1112,13 @@ def run_command(command: str) -> None:
         SystemExit: If command execution fails
         
     Platform Handling:
-        - Windows: Uses shlex.split() or cmd.exe fallback
-        - Unix: Uses bash -c for execution
+        - Both: shlex.split() into argv (posix=False on Windows) and exec curl
+          directly by absolute path (shell=False, no bash/cmd.exe wrapper)
         
     Output Formatting:
         - STDOUT: Displayed in green, JSON is pretty-printed if detected
         - STDERR: Displayed in red
+        - -o/--output/-O: curl writes straight to the terminal (not captured)
         - Exit code: Checked and error displayed if non-zero
         
     Flow:
@@ -506,84 +1129,158 @@ def run_command(command: str) -> None:
         5. Display output with appropriate colors
         6. Check exit code and display error if non-zero
     """
-    debug_print(f"run_command called with command: {command[:100]}{'...' if len(command) > 100 else ''}")
-    debug_print(f"Platform: {os.name} (windows={os.name == 'nt'})")
+    if utils.DEBUG:
+        debug_print(f"run_command called with command: {command[:100]}{'...' if len(command) > 100 else ''}")
+        debug_print(f"Platform: {os.name} (windows={IS_WINDOWS})")
     
     try:
-        print(f"\n{Colors.CYAN}▶ Running your cURL command...{Colors.RESET}")
+        print(_RUNNING_LABEL)
 
         # Use the hardened command execution
         try:
-            debug_print(f"Calling run_curl_command with windows={os.name == 'nt'}")
-            result = run_curl_command(command, windows=(os.name == 'nt'))
+            debug_print(f"Calling run_curl_command with windows={IS_WINDOWS}")
+            # stream=True: a single command can show its output as it arrives
+            result = run_curl_command(command, windows=IS_WINDOWS, stream=True)
             debug_print(f"Command execution successful: returncode={result.returncode}")
         except (ValueError, RuntimeError) as e:
             debug_print(f"Command execution failed with {type(e).__name__}: {e}")
             print_error(f"Command execution failed: {e}")
             return
 
-        # Print stdout (standard output from curl command)
-        if result.stdout:
-            debug_print(f"STDOUT received: {len(result.stdout)} bytes")
-            print(f"{Colors.GREEN}STDOUT:{Colors.RESET}")
-            # out: Stripped stdout (removes leading/trailing whitespace)
-            out = result.stdout.strip()
-            
-            # Try to pretty-print JSON if applicable
-            # pretty_printed: Flag indicating if JSON was detected and formatted
-            # If True, JSON was found and pretty-printed; if False, output is printed as-is
-            pretty_printed = False
-            if out:
-                debug_print(f"Checking if STDOUT is JSON (first 50 chars: {out[:50]})")
-                # Fast-path: Check if output looks like JSON
-                # trimmed: Output with leading whitespace removed (for checking start)
-                # Check if output starts with { or [ and ends with } or ]
-                trimmed = out.lstrip()
-                if (trimmed.startswith('{') and out.rstrip().endswith('}')) or (trimmed.startswith('[') and out.rstrip().endswith(']')):
-                    debug_print("STDOUT looks like JSON, attempting to parse")
-                    try:
-                        # data: Parsed JSON object (dict or list)
-                        data = json.loads(out)
-                        debug_print(f"JSON parsed successfully: type={type(data).__name__}")
-                        # formatted: Pretty-printed JSON string with 2-space indentation
-                        # ensure_ascii=False: Allow Unicode characters in output
-                        formatted = json.dumps(data, indent=2, ensure_ascii=False)
-                        print(formatted)
-                        pretty_printed = True
-                        debug_print("Pretty-printed JSON response")
-                    except json.JSONDecodeError as e:
-                        # If JSON parsing fails, output didn't contain valid JSON
-                        debug_print(f"STDOUT looked like JSON but failed to parse: {e}")
-                        debug_print("Printing raw output instead")
-            if not pretty_printed:
-                # If JSON not detected or parsing failed, print output as-is
-                debug_print("Printing STDOUT as raw text (not JSON)")
-                print(result.stdout)
-        else:
-            debug_print("No STDOUT received from command")
-
-        # Print stderr (error output from curl command)
-        # stderr typically contains warnings, errors, or verbose output
-        if result.stderr:
-            debug_print(f"STDERR received: {len(result.stderr)} bytes")
-            print(f"{Colors.RED}STDERR:{Colors.RESET}")
-            print(result.stderr)
-        else:
-            debug_print("No STDERR received from command")
-
-        # Check exit code
-        # result.returncode: Exit code from curl command
-        # 0 = success, non-zero = error
-        debug_print(f"Process exited with code: {result.returncode}")
-        if result.returncode != 0:
-            debug_print(f"Command failed with non-zero exit code: {result.returncode}")
-            print_error(f"cURL execution failed with exit code {result.returncode}")
-        else:
-            debug_print("Command executed successfully (exit code 0)")
+        _display_result(result)
 
     except Exception as e:
         debug_print(f"Unexpected exception in run_command: {type(e).__name__}: {e}")
-        import traceback
-        debug_print(f"Traceback: {traceback.format_exc()}")
+        # format_exc() walks the whole stack; only pay for it when it will be shown
+        if utils.DEBUG:
+            # Imported lazily, like json/selectors: this handler is a cold path
+            import traceback
+            debug_print(f"Traceback: {traceback.format_exc()}")
         print_error(f"Failed to execute command: {e}")
 
+
+
+def _writes_to_terminal(command: str, windows: bool = False) -> bool:
+    """
+    Check whether curl would write straight to the terminal for this command.
+
+    Commands with a file-output flag (_FILE_OUTPUT_FLAGS, including -o -)
+    inherit stdout/stderr in run_curl_command() instead of being captured.
+
+    Args:
+        command: Validated curl command string
+        windows: Whether running on Windows (affects parsing)
+
+    Returns:
+        True if curl's output is not captured, False otherwise (or if the
+        command cannot be parsed; run_curl_command() then reports the error)
+    """
+    try:
+        parts = _split_command(command, not windows)
+    except ValueError:
+        return False
+    return any(part.split('=')[0] in _FILE_OUTPUT_FLAGS for part in parts[1:])
+
+
+def run_commands(
+    commands: List[str],
+    *,
+    sequential: bool = False,
+    max_workers: int = _MAX_PARALLEL_COMMANDS,
+) -> None:
+    """
+    Execute several curl commands, concurrently unless told otherwise.
+
+    Network-bound curl calls are independent by default, so they are
+    started together on a small thread pool (total time ~ slowest request
+    instead of the sum). Results are collected and then displayed one by
+    one in the original order, so the output reads as it would for
+    a sequential run. By then every call has already run, so a failed
+    result does not stop the display: all outcomes are shown and the
+    program exits once at the end. Commands whose curl writes straight
+    to the terminal (_writes_to_terminal) are kept off the pool, so their
+    output cannot interleave: each runs on its own, in order, under its
+    header.
+
+    Args:
+        commands: Validated curl command strings to execute
+        sequential: Run curl calls one at a time (--sequential flag),
+                    for commands that depend on each other (e.g. cookie jars)
+        max_workers: Upper bound on concurrently running curl processes
+
+    Raises:
+        SystemExit: If a command fails to execute or exits non-zero
+                    (sequential: at the failing command; parallel: after all
+                    results are displayed)
+
+    Flow:
+        1. Fall back to run_command() if there is a single command
+        2. Run each command with run_curl_command(), on a ThreadPoolExecutor
+           unless sequential or the command writes to the terminal
+        3. Display each result in order under a [i/N] header
+           (terminal-writing commands run at this point, one at a time)
+        4. Parallel only: exit with code 1 if any command failed
+    """
+    total = len(commands)
+
+    if total == 1:
+        debug_print("Executing single command")
+        run_command(commands[0])
+        return
+
+    def execute(command: str):
+        """Run one curl call; return (result, error) so failures surface in order."""
+        try:
+            return run_curl_command(command, windows=IS_WINDOWS), None
+        except (ValueError, RuntimeError) as e:
+            return None, e
+
+    def display(index: int, command: str, outcome=None, fatal: bool = True) -> bool:
+        """Display one command's outcome (run it now if None); on failure exit, or return False if not fatal."""
+        print(f"\n{Colors.CYAN}▶ [{index}/{total}] {command}{Colors.RESET}")
+        if outcome is None:
+            # Runs after the header so terminal output lands under it
+            outcome = execute(command)
+        result, error = outcome
+        if error is not None:
+            debug_print(f"Command {index} execution failed with {type(error).__name__}: {error}")
+            print_error(f"Command execution failed: {error}", fatal=fatal)
+            return False
+        try:
+            return _display_result(result, fatal)
+        except Exception as e:
+            debug_print(f"Unexpected exception displaying command {index}: {type(e).__name__}: {e}")
+            print_error(f"Failed to execute command: {e}", fatal=fatal)
+            return False
+
+    if sequential:
+        print(f"\n{Colors.CYAN}▶ Running {total} cURL commands sequentially...{Colors.RESET}")
+        debug_print(f"Executing {total} curl call(s) sequentially")
+        for index, command in enumerate(commands, 1):
+            display(index, command)
+        return
+
+    # Imported lazily: only multi-command runs need the thread pool
+    from concurrent.futures import ThreadPoolExecutor
+
+    # direct: Per command, True if curl writes straight to the terminal (run later, unpooled)
+    direct = [_writes_to_terminal(command, IS_WINDOWS) for command in commands]
+    pooled = [command for command, is_direct in zip(commands, direct) if not is_direct]
+    print(f"\n{Colors.CYAN}▶ Running {total} cURL commands in parallel...{Colors.RESET}")
+    outcomes = iter(())
+    if pooled:
+        # workers: Bounded so a long command list does not open dozens of connections at once
+        workers = max(1, min(max_workers, len(pooled)))
+        debug_print(f"Executing {len(pooled)} curl call(s) on {workers} worker thread(s), "
+                    f"{total - len(pooled)} streaming to the terminal one at a time")
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # executor.map() preserves input order regardless of completion order
+            outcomes = iter(list(executor.map(execute, pooled)))
+
+    # failed: Number of commands that failed; pooled calls already ran, so all outcomes are shown first
+    failed = 0
+    for index, (command, is_direct) in enumerate(zip(commands, direct), 1):
+        if not display(index, command, None if is_direct else next(outcomes), fatal=False):
+            failed += 1
+    if failed:
+        print_error(f"{failed} of {total} cURL command(s) failed")
@@ -11,6 +11,10 @@ Variables:
     __version__: Application version string (e.g., "1.0.0")
     __author__: Author name and email
     __license__: License identifier (GPL-3.0-or-later)
+    IS_WINDOWS: True when running on Windows (os.name == 'nt'), evaluated once at import
+    CACHE_DIR: Per-user cache directory for files reused across runs
+               ($XDG_CACHE_HOME/curlpad, default ~/.cache/curlpad)
+    USE_COLOR: True when stdout and stderr are terminals and NO_COLOR is unset
     Colors: Class containing ANSI escape codes for colored terminal output
         - RED: Red text color
         - GREEN: Green text color
@@ -20,12 +24,25 @@ Variables:
         - CYAN: Cyan text color
         - RESET: Reset color to default
         - BOLD: Bold text formatting
+        All codes are blanked at import when USE_COLOR is False
 """
 
+import os
+import sys
+
 __version__ = "1.3.2"
 __author__ = "Akshat Kotpalliwar <inquiry.akshatkotpalliwar@gmail.com>"
 __license__ = "GPL-3.0-or-later"
 
+# Platform is invariant for the lifetime of the process, so check it once
+IS_WINDOWS = os.name == 'nt'
+
+# Per-user cache shared across runs (command path cache, completion dictionary)
+CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+    'curlpad',
+)
+
 
 class Colors:
     """
@@ -35,6 +52,9 @@ class Colors:
     colored output in the terminal. They use ANSI escape sequences
     that work on most modern terminals.
     
+    When USE_COLOR is False (output piped/redirected, or NO_COLOR set),
+    every code is replaced with '' so no escape bytes are written.
+    
     Usage:
         print(f"{Colors.RED}Error message{Colors.RESET}")
         print(f"{Colors.GREEN}Success message{Colors.RESET}")
@@ -48,3 +68,24 @@ class Colors:
     RESET = '\033[0m'     # Reset to default terminal color
     BOLD = '\033[1m'      # Bold text formatting
 
+
+def _is_tty(stream) -> bool:
+    """Return True if stream is an interactive terminal (False if missing/closed)."""
+    try:
+        return stream is not None and stream.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+
+# Colored output only makes sense on a terminal; honor NO_COLOR (https://no-color.org)
+USE_COLOR = (
+    os.environ.get('NO_COLOR') is None
+    and _is_tty(sys.stdout)
+    and _is_tty(sys.stderr)
+)
+
+if not USE_COLOR:
+    # Blank every escape code once so f"{Colors.X}...{Colors.RESET}" emits plain text
+    for _name in ('RED', 'GREEN', 'YELLOW', 'BLUE', 'MAGENTA', 'CYAN', 'RESET', 'BOLD'):
+        setattr(Colors, _name, '')
+    del _name
@@ -7,6 +7,9 @@ This module handles checking for and installing required dependencies:
     - jq: Optional, used for JSON formatting
 
 Functions:
+    find_command(command: str) -> Optional[str]
+        Resolve a command to its full path (cached on disk across runs)
+        
     check_command(command: str) -> bool
         Check if a command exists in the system PATH
         
@@ -25,29 +28,169 @@ Flow:
     3. install_deps() can install vim/jq if --install flag is used
 """
 
-import platform
+import functools
+import os
 import shutil
+import stat
 import subprocess
+import tempfile
+import time
+import types
+import zlib
+from typing import Dict, Optional
 
+from curlpad.constants import CACHE_DIR, IS_WINDOWS
 from curlpad.output import print_error, print_info, print_success, print_warning
-from curlpad.utils import debug_print
+from curlpad import utils
+from curlpad.utils import debug_print, write_all
 
 # Trusted absolute paths for package managers (security: prevent PATH hijacking)
-TRUSTED_BINARIES = {
+# Read-only view: the allowlist cannot be modified at runtime
+TRUSTED_BINARIES = types.MappingProxyType({
     'apt-get': '/usr/bin/apt-get',
     'dnf': '/usr/bin/dnf',
     'yum': '/usr/bin/yum',
     'brew': '/usr/local/bin/brew',
     'sudo': '/usr/bin/sudo'
-}
+})
+
+# On-disk cache of resolved command paths, shared across runs
+# First line is a hash of $PATH; each further line is "<command>\t<full path>"
+_PATH_CACHE_FILE = os.path.join(CACHE_DIR, 'paths')
+
+# apt package lists directory; its mtime changes on every successful 'apt-get update'
+_APT_LISTS_DIR = '/var/lib/apt/lists'
+# Skip 'apt-get update' when the package lists were refreshed within this many seconds
+_APT_CACHE_MAX_AGE = 24 * 60 * 60
+
+# Package managers install_deps() can drive, per platform.system().lower(), in probe order
+# Each entry: (binary, needs sudo, package-list refresh args or None, install args)
+# Every binary must also be listed in TRUSTED_BINARIES
+_PACKAGE_MANAGERS = types.MappingProxyType({
+    'linux': (
+        ('apt-get', True, ('update',), ('install', '-y', 'vim', 'jq')),  # Debian/Ubuntu
+        ('dnf', True, None, ('install', '-y', 'vim', 'jq')),             # RHEL/CentOS/Fedora
+        ('yum', True, None, ('install', '-y', 'vim', 'jq')),             # Older RHEL/CentOS
+    ),
+    'darwin': (
+        ('brew', False, None, ('install', 'vim', 'jq')),                 # macOS (Homebrew)
+    ),
+})
+# Shown when no package manager from _PACKAGE_MANAGERS is installed on the platform
+_NO_PACKAGE_MANAGER = types.MappingProxyType({
+    'linux': "Cannot auto-install: unsupported package manager.\nPlease install vim and jq manually:\n  Ubuntu/Debian: sudo apt install vim jq\n  RHEL/CentOS: sudo yum install vim jq",
+    'darwin': "Cannot auto-install: Homebrew not found.\nPlease install Homebrew and run: brew install vim jq",
+})
+
+
+def _path_key() -> str:
+    """Return a short hash of $PATH; cached paths are only valid for the same PATH."""
+    path_env = os.environ.get('PATH', '').encode('utf-8', 'surrogateescape')
+    return f"{zlib.crc32(path_env):08x}"
+
+
+@functools.lru_cache(maxsize=1)
+def _path_cache() -> Dict[str, str]:
+    """
+    Load cached command paths for the current $PATH.
+
+    The file is only used if it is a regular file with mode 0o600 owned by
+    the current user (mode/owner are not checked on Windows), like the
+    cached dictionary in templates.py.
+
+    Returns:
+        Mapping of command name to full path (empty if the cache file is
+        missing, unreadable, not trusted, or was written for a different PATH).
+        The same dict is returned on every call and updated in place.
+    """
+    try:
+        with open(_PATH_CACHE_FILE, 'r', encoding='utf-8') as f:
+            # fstat() on the open file: the checked file is the one being read
+            st = os.fstat(f.fileno())
+            if not stat.S_ISREG(st.st_mode) or (not IS_WINDOWS and (
+                    stat.S_IMODE(st.st_mode) != 0o600 or st.st_uid != os.getuid())):
+                debug_print("Command path cache has unexpected type, mode or owner; ignoring it")
+                return {}
+            if f.readline().rstrip('\n') != _path_key():
+                debug_print("Command path cache is for a different PATH; ignoring it")
+                return {}
+            entries = dict(line.rstrip('\n').split('\t', 1) for line in f if '\t' in line)
+    except (OSError, UnicodeDecodeError) as e:
+        debug_print(f"No usable command path cache ({type(e).__name__}); probing PATH")
+        return {}
+    debug_print(f"Loaded {len(entries)} cached command path(s) from {_PATH_CACHE_FILE}")
+    return entries
 
 
+def _save_path_cache(entries: Dict[str, str]) -> None:
+    """
+    Write the command path cache atomically (temp file + os.replace).
+
+    Failures are logged and ignored: the cache is only an optimization.
+    """
+    cache_dir = os.path.dirname(_PATH_CACHE_FILE)
+    payload = ''.join([_path_key(), '\n'] + [f"{name}\t{path}\n" for name, path in entries.items()])
+    tmp = None
+    try:
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(prefix='.paths-', dir=cache_dir)
+        try:
+            write_all(fd, payload.encode('utf-8', 'surrogateescape'))
+        finally:
+            os.close(fd)
+        os.replace(tmp, _PATH_CACHE_FILE)
+        debug_print(f"Saved {len(entries)} command path(s) to {_PATH_CACHE_FILE}")
+    except OSError as e:
+        debug_print(f"Could not save command path cache: {e}")
+        if tmp is not None:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+
+
+def find_command(command: str) -> Optional[str]:
+    """
+    Resolve a command to its full path, using the on-disk cache when possible.
+    
+    A cached path is trusted only if it is still executable (one os.access
+    call instead of a full PATH walk). Otherwise shutil.which() is used and
+    the cache is updated. Only successful lookups are cached, so a tool
+    installed later (e.g. via --install) is found on the next run.
+    Executed or security-checked binaries (curl, verify_binary()) are
+    resolved with shutil.which() instead.
+    
+    Args:
+        command: Command name to resolve (e.g., 'curl', 'jq', 'nvim')
+        
+    Returns:
+        Full path to the executable, or None if not found in PATH
+    """
+    cache = _path_cache()
+    path = cache.get(command)
+    if path and os.access(path, os.X_OK):
+        return path
+
+    path = shutil.which(command)
+    if path:
+        cache[command] = path
+        _save_path_cache(cache)
+    elif command in cache:
+        # Cached path went stale and the command is gone from PATH
+        del cache[command]
+        _save_path_cache(cache)
+    return path
+
+
+@functools.lru_cache(maxsize=None)
 def check_command(command: str) -> bool:
     """
     Check if a command exists in the system PATH.
     
-    Uses shutil.which() to search for the command in PATH.
+    Uses find_command() (on-disk cache, then shutil.which()) to search PATH.
     Logs the result when DEBUG mode is enabled.
+    The result is memoized per command name (functools.lru_cache), so
+    repeated lookups such as check_command('jq') never rescan PATH.
     
     Args:
         command: Command name to check (e.g., 'curl', 'vim', 'nvim')
@@ -58,36 +201,45 @@ def check_command(command: str) -> bool:
         
     Variables:
         path: Full path to the command executable, or None if not found
-              Returned by shutil.which() which searches PATH environment variable
+              Returned by find_command() (cache or PATH search)
               
     Flow:
-        1. Call shutil.which(command) to search PATH
-        2. Log result if DEBUG mode enabled
-        3. Return True if path is not None, False otherwise
+        1. Return cached result if this command was already checked
+        2. Call find_command(command) (cached path or shutil.which())
+        3. Log result if DEBUG mode enabled
+        4. Return True if path is not None, False otherwise
         
     Usage:
         if check_command('curl'):
             print("curl is installed")
     """
-    debug_print(f"Checking for command in PATH: '{command}'")
     # path: Full path to command executable, or None if command not found in PATH
-    # shutil.which() searches the PATH environment variable for the command
-    # On Windows, also checks .exe, .cmd, .bat extensions automatically
-    path = shutil.which(command)
-    if path:
-        debug_print(f"Command '{command}' found at: {path}")
-    else:
-        debug_print(f"Command '{command}' not found in PATH")
+    # find_command() reuses the on-disk cache, falling back to shutil.which()
+    # On Windows, shutil.which() also checks .exe, .cmd, .bat extensions automatically
+    path = find_command(command)
+    # Messages are only built when DEBUG is enabled
+    if utils.DEBUG:
+        if path:
+            debug_print(f"Command '{command}' found at: {path}")
+        else:
+            debug_print(f"Command '{command}' not found in PATH")
     return path is not None
 
 
+@functools.lru_cache(maxsize=1)
 def get_editor() -> str:
     """
     Detect and return available editor (prefers nvim over vim).
     
     Checks for editors in order of preference:
-        1. nvim (Neovim) - preferred for better Lua support
-        2. vim (Vim) - fallback option
+        1. $VISUAL / $EDITOR, if it names nvim or vim - the user's choice
+           is probed first, so a vim user does not pay for an nvim lookup
+        2. nvim (Neovim) - preferred for better Lua support
+        3. vim (Vim) - fallback option
+        
+    The result is memoized (functools.lru_cache) so PATH is scanned at most
+    once per process, even though both create_editor_config() and
+    open_editor() ask for the editor.
         
     Returns:
         Editor name as string ('nvim' or 'vim')
@@ -96,20 +248,27 @@ def get_editor() -> str:
         SystemExit: If neither editor is found
         
     Flow:
-        1. Check for 'nvim' in PATH
-        2. If not found, check for 'vim' in PATH
-        3. If neither found, print error and exit
+        1. Put the $VISUAL/$EDITOR editor first if it is nvim or vim
+        2. Check each candidate ('nvim', then 'vim') in PATH
+        3. Return the first one found
+        4. If neither found, print error and exit
     """
     debug_print("Detecting available editor (preferring nvim over vim)...")
-    if check_command('nvim'):
-        debug_print("Selected editor: nvim (preferred)")
-        return 'nvim'
-    elif check_command('vim'):
-        debug_print("Selected editor: vim (fallback)")
-        return 'vim'
-    else:
-        debug_print("ERROR: Neither nvim nor vim found in PATH")
-        print_error("Neither nvim nor vim is installed.\nRun 'python3 curlpad.py --install' to install dependencies.")
+    # candidates: Supported editors in probe order
+    # Other editors named in $VISUAL/$EDITOR are ignored: the generated config is vim/nvim only
+    candidates = ('nvim', 'vim')
+    preferred = os.environ.get('VISUAL') or os.environ.get('EDITOR') or ''
+    # basename() so '/usr/bin/vim' works; split() drops arguments such as 'vim -u NONE'
+    preferred = os.path.basename(preferred.split()[0]) if preferred.strip() else ''
+    if preferred == 'vim':
+        debug_print("$VISUAL/$EDITOR names vim; checking it first")
+        candidates = ('vim', 'nvim')
+    for editor in candidates:
+        if check_command(editor):
+            debug_print(f"Selected editor: {editor}{' (preferred)' if editor == candidates[0] else ' (fallback)'}")
+            return editor
+    debug_print("ERROR: Neither nvim nor vim found in PATH")
+    print_error("Neither nvim nor vim is installed.\nRun 'python3 curlpad.py --install' to install dependencies.")
 
 
 def verify_binary(name: str) -> str:
@@ -118,6 +277,9 @@ def verify_binary(name: str) -> str:
     
     Prevents PATH hijacking attacks by ensuring package managers
     are in their standard system locations.
+    The path is resolved with shutil.which(), never the on-disk
+    find_command() cache, so a stale or planted cache entry cannot
+    bypass the check.
     
     Args:
         name: Binary name to verify (e.g., 'apt-get', 'dnf', 'sudo')
@@ -128,25 +290,32 @@ def verify_binary(name: str) -> str:
     Raises:
         RuntimeError: If binary not found or in unexpected location
     """
-    debug_print(f"Verifying binary: {name}")
+    # debug: Snapshot of utils.DEBUG; messages on the normal path are only built when set
+    debug = utils.DEBUG
+    if debug:
+        debug_print(f"Verifying binary: {name}")
     expected_path = TRUSTED_BINARIES.get(name)
     if not expected_path:
         debug_print(f"ERROR: Unknown binary '{name}' not in TRUSTED_BINARIES")
         raise ValueError(f"Unknown binary: {name}")
     
-    debug_print(f"Expected path for {name}: {expected_path}")
+    if debug:
+        debug_print(f"Expected path for {name}: {expected_path}")
+    # shutil.which(): the binary the current PATH actually resolves to (no cache)
     actual_path = shutil.which(name)
-    debug_print(f"Actual path found for {name}: {actual_path}")
+    if debug:
+        debug_print(f"Actual path found for {name}: {actual_path}")
     
     if not actual_path:
         debug_print(f"ERROR: Binary '{name}' not found in PATH")
         raise RuntimeError(f"Binary '{name}' not found in PATH")
     
     if actual_path != expected_path:
-        debug_print(f"WARNING: Binary {name} at unexpected location!")
-        debug_print(f"  Expected: {expected_path}")
-        debug_print(f"  Found:    {actual_path}")
-        debug_print("  This could indicate a PATH hijacking attempt")
+        if debug:
+            debug_print(f"WARNING: Binary {name} at unexpected location!")
+            debug_print(f"  Expected: {expected_path}")
+            debug_print(f"  Found:    {actual_path}")
+            debug_print("  This could indicate a PATH hijacking attempt")
         print_warning(f"Binary {name} found at unexpected location:")
         print_warning(f"  Expected: {expected_path}")
         print_warning(f"  Found:    {actual_path}")
@@ -158,12 +327,29 @@ def verify_binary(name: str) -> str:
             raise RuntimeError("Installation aborted by user due to unexpected binary location")
         
         debug_print(f"User approved non-standard binary location for {name}")
-    else:
+    elif debug:
         debug_print(f"Binary {name} verified at expected location: {actual_path}")
     
     return actual_path
 
 
+def _apt_cache_is_fresh() -> bool:
+    """
+    Check whether apt's package lists were refreshed recently.
+
+    Returns:
+        True if _APT_LISTS_DIR was modified less than _APT_CACHE_MAX_AGE
+        seconds ago, False if it is older or cannot be inspected
+    """
+    try:
+        age = time.time() - os.stat(_APT_LISTS_DIR).st_mtime
+    except OSError as e:
+        debug_print(f"Cannot stat {_APT_LISTS_DIR}: {e}; assuming stale package lists")
+        return False
+    debug_print(f"apt package lists age: {int(age)}s (max {_APT_CACHE_MAX_AGE}s)")
+    return age < _APT_CACHE_MAX_AGE
+
+
 def check_dependencies() -> None:
     """
     Verify that required dependencies are installed.
@@ -195,6 +381,7 @@ def install_deps() -> None:
         - macOS: Homebrew
         
     Security:
+        - Uses sudo only when not already running as root
         - Verifies package manager binaries are in trusted locations
         - Uses absolute paths to prevent PATH hijacking
         - Validates binary locations before execution
@@ -205,71 +392,64 @@ def install_deps() -> None:
         
     Flow:
         1. Detect platform (linux/darwin)
-        2. Detect and verify package manager location
-        3. Run package manager with absolute path
-        4. Print success message
+        2. Pick the first installed package manager from _PACKAGE_MANAGERS
+        3. Verify sudo (when needed and not already root) and package manager locations
+        4. Run package manager with absolute path
+           (apt-get update is skipped when package lists are under a day old)
+        5. Print success message
         
     Usage:
         Called via --install CLI flag
     """
+    # Imported lazily: only the --install path needs platform detection
+    import platform
+
     print_info("Installing missing dependencies...")
 
     system = platform.system().lower()
     debug_print(f"Detected platform: {system}")
     
     try:
-        if system == "linux":
-            # Try different package managers
-            if check_command('apt-get'):
-                # Debian/Ubuntu - verify binaries before use
-                debug_print("Using apt-get for installation")
-                debug_print("Verifying sudo binary...")
-                sudo_path = verify_binary('sudo')
-                debug_print("Verifying apt-get binary...")
-                apt_path = verify_binary('apt-get')
-                
-                debug_print(f"Executing: {sudo_path} {apt_path} update")
-                print_info("Running: sudo apt-get update")
-                result = subprocess.run([sudo_path, apt_path, 'update'], check=True, capture_output=True, text=True)
-                debug_print(f"apt-get update completed: returncode={result.returncode}")
-                
-                debug_print(f"Executing: {sudo_path} {apt_path} install -y vim jq")
-                print_info("Running: sudo apt-get install -y vim jq")
-                result = subprocess.run([sudo_path, apt_path, 'install', '-y', 'vim', 'jq'], check=True, capture_output=True, text=True)
-                debug_print(f"apt-get install completed: returncode={result.returncode}")
-                
-            elif check_command('dnf'):
-                # RHEL/CentOS/Fedora
-                debug_print("Using dnf for installation")
-                sudo_path = verify_binary('sudo')
-                dnf_path = verify_binary('dnf')
-                
-                print_info("Running: sudo dnf install -y vim jq")
-                subprocess.run([sudo_path, dnf_path, 'install', '-y', 'vim', 'jq'], check=True)
-                
-            elif check_command('yum'):
-                # Older RHEL/CentOS
-                debug_print("Using yum for installation")
-                sudo_path = verify_binary('sudo')
-                yum_path = verify_binary('yum')
-                
-                print_info("Running: sudo yum install -y vim jq")
-                subprocess.run([sudo_path, yum_path, 'install', '-y', 'vim', 'jq'], check=True)
-            else:
-                print_error("Cannot auto-install: unsupported package manager.\nPlease install vim and jq manually:\n  Ubuntu/Debian: sudo apt install vim jq\n  RHEL/CentOS: sudo yum install vim jq")
-                
-        elif system == "darwin":
-            # macOS
-            if check_command('brew'):
-                debug_print("Using Homebrew for installation")
-                brew_path = verify_binary('brew')
-                
-                print_info("Running: brew install vim jq")
-                subprocess.run([brew_path, 'install', 'vim', 'jq'], check=True)
-            else:
-                print_error("Cannot auto-install: Homebrew not found.\nPlease install Homebrew and run: brew install vim jq")
-        else:
+        if system not in _PACKAGE_MANAGERS:
             print_error(f"Unsupported platform: {system}")
+
+        # First package manager of this platform that is installed wins
+        for name, needs_sudo, refresh_args, install_args in _PACKAGE_MANAGERS[system]:
+            if check_command(name):
+                break
+        else:
+            print_error(_NO_PACKAGE_MANAGER[system])
+
+        # Verify binaries before use (absolute paths, trusted locations)
+        debug_print(f"Using {name} for installation")
+        # Already root (containers, CI): run the package manager directly
+        # sudo may not even be installed there, and would only add a PAM/sudoers round-trip
+        if needs_sudo and hasattr(os, 'geteuid') and os.geteuid() == 0:
+            debug_print("Running as root; not using sudo")
+            needs_sudo = False
+        prefix = []
+        if needs_sudo:
+            debug_print("Verifying sudo binary...")
+            prefix.append(verify_binary('sudo'))
+        debug_print(f"Verifying {name} binary...")
+        pm_path = verify_binary(name)
+        # shown: Command as presented to the user (short names, not absolute paths)
+        shown = ('sudo ' if needs_sudo else '') + name
+
+        if refresh_args:
+            # Refresh package lists only when stale (update hits the network)
+            # Only apt-get has a refresh step, so the apt lists directory is what gets checked
+            if _apt_cache_is_fresh():
+                print_info(f"Skipping {name} {' '.join(refresh_args)} (package lists refreshed within the last day)")
+            else:
+                print_info(f"Running: {shown} {' '.join(refresh_args)}")
+                # Output goes straight to the terminal; only returncode is used
+                result = subprocess.run([*prefix, pm_path, *refresh_args], check=True)
+                debug_print(f"{name} {' '.join(refresh_args)} completed: returncode={result.returncode}")
+
+        print_info(f"Running: {shown} {' '.join(install_args)}")
+        result = subprocess.run([*prefix, pm_path, *install_args], check=True)
+        debug_print(f"{name} {' '.join(install_args)} completed: returncode={result.returncode}")
         
         print_success("Dependencies installed.")
         
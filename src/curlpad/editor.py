@@ -6,7 +6,7 @@ This module handles editor-related functionality:
     - open_editor(): Launches the editor with the template file
 
 Functions:
-    create_editor_config(target_file: str) -> str
+    create_editor_config(target_file: str, editor: Optional[str] = None) -> str
         Create temporary vimrc/lua file with curl completion settings
         
     open_editor(tmpfile: str) -> None
@@ -23,11 +23,99 @@ Flow:
 import os
 import subprocess
 import tempfile
+from typing import Optional
 
 from curlpad.dependencies import get_editor
 from curlpad.output import print_error
 from curlpad.templates import create_curl_dict
-from curlpad.utils import temp_files, debug_print, DEBUG
+from curlpad import utils
+from curlpad.utils import temp_files, debug_print, get_temp_dir, write_all
+
+# _TEMP_DIR: System temp directory with symlinks resolved, computed once at import
+# create_editor_config() only accepts target files below it
+_TEMP_DIR = os.path.realpath(tempfile.gettempdir())
+
+# Editor config templates, built once at import and filled with %-substitution
+# Using %(name)s placeholders keeps Lua/Vimscript braces literal (no {{ }} escaping)
+_NVIM_CONFIG_TEMPLATE = '''-- Neovim Lua configuration for curl completion
+local dict_file = [[%(dict_file)s]]
+local target_path = [[%(target_path)s]]
+
+-- Enable syntax highlighting
+vim.cmd('syntax on')
+
+-- Basic UI/options
+vim.o.number = true
+vim.o.autoindent = true
+vim.o.tabstop = 2
+vim.o.shiftwidth = 2
+vim.o.expandtab = true
+vim.o.backspace = 'indent,eol,start'
+
+-- Enable truecolor and try to apply a builtin colorscheme
+vim.o.termguicolors = true
+pcall(vim.cmd, 'colorscheme elflord')
+
+-- Enable filetype detection, plugins, indent
+vim.cmd('filetype plugin indent on')
+
+-- Function to setup buffer
+local function setup_buffer(buf)
+  vim.bo[buf].filetype = 'sh'
+  -- Clear and set dictionary
+  vim.opt_local.dictionary = { dict_file }
+  vim.opt_local.complete:append('k')
+  vim.opt_local.completeopt = { 'menu', 'menuone', 'preview' }
+  -- Map Ctrl-Space to trigger dictionary completion for this buffer
+  pcall(vim.keymap.set, 'i', '<C-Space>', '<C-x><C-k>', { buffer = buf, noremap = true, silent = true })
+  -- Debug: verify settings
+  local dict_setting = vim.opt_local.dictionary:get()
+  local complete_setting = vim.opt_local.complete:get()
+  vim.api.nvim_echo({
+    { 'Curl autocomplete: Ctrl+Space or Ctrl+X Ctrl+K', 'Normal' },
+    { '  Dictionary: ' .. (dict_setting[1] or 'not set'), 'Comment' },
+    { '  Complete: ' .. table.concat(complete_setting, ','), 'Comment' }
+  }, true, {})
+end
+
+-- Apply to current buffer immediately
+vim.schedule(function()
+  local current_buf = vim.api.nvim_get_current_buf()
+  setup_buffer(current_buf)
+end)
+
+-- Also setup on buffer events
+vim.api.nvim_create_autocmd({ 'BufEnter', 'BufWinEnter' }, {
+  callback = function(args)
+    setup_buffer(args.buf)
+  end,
+  once = false,
+})
+'''
+
+_VIM_CONFIG_TEMPLATE = '''set nocompatible
+syntax on
+filetype plugin indent on
+set filetype=sh
+set number
+set autoindent
+set tabstop=2
+set shiftwidth=2
+set expandtab
+set backspace=indent,eol,start
+
+" Enable dictionary completion for curl commands
+" let with a string literal: the path may contain spaces (e.g. under ~/.cache)
+let &dictionary = "%(dict_file)s"
+set complete+=k
+set completeopt=menu,menuone,preview
+
+" Show helpful message
+echo "Curl autocomplete available: Press Ctrl+X Ctrl+K in insert mode for completion"
+'''
+
+# Vimscript escapes applied by sanitize_vim_string() in a single translate pass
+_VIM_ESCAPES = str.maketrans({'\\': '\\\\', '"': '\\"', "'": "\\'"})
 
 
 def sanitize_lua_string(s: str) -> str:
@@ -42,6 +130,9 @@ def sanitize_lua_string(s: str) -> str:
     Returns:
         Sanitized string safe for Lua string literals
     """
+    # Fast path: typical temp paths contain neither, so nothing is copied
+    if '\\' not in s and ']]' not in s:
+        return s
     # Escape backslashes first
     s = s.replace('\\', '\\\\')
     # Escape Lua string terminators
@@ -61,16 +152,15 @@ def sanitize_vim_string(s: str) -> str:
     Returns:
         Sanitized string safe for Vimscript string literals
     """
-    # Escape backslashes first
-    s = s.replace('\\', '\\\\')
-    # Escape double quotes
-    s = s.replace('"', '\\"')
-    # Escape single quotes
-    s = s.replace("'", "\\'")
-    return s
+    # Fast path: typical temp paths have no backslash or quote, so nothing is copied
+    if '\\' not in s and '"' not in s and "'" not in s:
+        return s
+    # One str.translate() pass escapes backslashes and both quote kinds
+    # (each character is mapped once, so a backslash added for a quote is never re-escaped)
+    return s.translate(_VIM_ESCAPES)
 
 
-def create_editor_config(target_file: str) -> str:
+def create_editor_config(target_file: str, editor: Optional[str] = None) -> str:
     """
     Create temporary vimrc/lua file with curl completion settings.
     
@@ -92,6 +182,8 @@ def create_editor_config(target_file: str) -> str:
     Args:
         target_file: Path to the template file being edited
                     Must be under system temp directory
+        editor: Already-resolved editor name ('nvim' or 'vim').
+                If None, get_editor() is called to detect it.
         
     Returns:
         Path to the created configuration file
@@ -103,171 +195,130 @@ def create_editor_config(target_file: str) -> str:
     Flow:
         1. Validate target_file path
         2. Create curl dictionary file for autocomplete
-        3. Detect editor type (nvim or vim)
+        3. Detect editor type (nvim or vim) unless passed by caller
         4. Sanitize paths for safe interpolation
         5. Generate editor-specific config content
         6. Create temporary config file (.lua or .vimrc)
-        7. Add file to temp_files list
+        7. Add file to temp_files set
         8. Return config file path
     """
-    debug_print(f"create_editor_config called with target_file: {target_file}")
+    # debug: Snapshot of utils.DEBUG; f-string messages are only built when it is set
+    debug = utils.DEBUG
+    if debug:
+        debug_print(f"create_editor_config called with target_file: {target_file}")
     
     # Validate target_file is under temp directory (prevent path traversal)
-    target_file_abs = os.path.abspath(target_file)
-    temp_dir = tempfile.gettempdir()
-    debug_print(f"Target file absolute path: {target_file_abs}")
-    debug_print(f"Temp directory: {temp_dir}")
+    # realpath() resolves symlinks and '..' so they cannot escape the temp directory
+    target_file_abs = os.path.realpath(target_file)
+    temp_dir = _TEMP_DIR
+    if debug:
+        debug_print(f"Target file absolute path: {target_file_abs}")
+        debug_print(f"Temp directory: {temp_dir}")
     
-    if not target_file_abs.startswith(temp_dir):
+    # commonpath() compares whole path components ('/tmpfoo' is not under '/tmp')
+    # ValueError: different drives on Windows, which also means outside the temp directory
+    try:
+        inside_temp = os.path.commonpath([target_file_abs, temp_dir]) == temp_dir
+    except ValueError:
+        inside_temp = False
+    if not inside_temp:
         debug_print(f"SECURITY ERROR: Path traversal attempt detected!")
         debug_print(f"  Target: {target_file_abs}")
         debug_print(f"  Temp dir: {temp_dir}")
         raise ValueError(f"Invalid target file path: {target_file_abs} (not under temp directory)")
     
-    debug_print(f"Path validation passed: {target_file_abs}")
+    if debug:
+        debug_print(f"Path validation passed: {target_file_abs}")
     
     # Create curl dictionary file
     debug_print("Creating curl dictionary file...")
     dict_file = create_curl_dict()
-    debug_print(f"Dictionary file created: {dict_file}")
+    if debug:
+        debug_print(f"Dictionary file created: {dict_file}")
     
-    # Detect editor
-    debug_print("Detecting available editor...")
-    editor = get_editor()
-    debug_print(f"Selected editor: {editor}")
+    # Detect editor (skipped when the caller already resolved it)
+    if editor is None:
+        debug_print("Detecting available editor...")
+        editor = get_editor()
+    if debug:
+        debug_print(f"Selected editor: {editor}")
 
     if editor == 'nvim':
         # Neovim Lua configuration with sanitized paths
         debug_print("Sanitizing paths for Lua interpolation...")
         dict_file_safe = sanitize_lua_string(dict_file)
         target_file_safe = sanitize_lua_string(target_file_abs)
-        debug_print(f"Sanitized dict_file: {len(dict_file_safe)} chars")
-        debug_print(f"Sanitized target_file: {len(target_file_safe)} chars")
+        if debug:
+            debug_print(f"Sanitized dict_file: {len(dict_file_safe)} chars")
+            debug_print(f"Sanitized target_file: {len(target_file_safe)} chars")
         
         debug_print("Generating Neovim Lua configuration...")
-        config_content = f'''-- Neovim Lua configuration for curl completion
-local dict_file = [[{dict_file_safe}]]
-local target_path = [[{target_file_safe}]]
-
--- Enable syntax highlighting
-vim.cmd('syntax on')
-
--- Basic UI/options
-vim.o.number = true
-vim.o.autoindent = true
-vim.o.tabstop = 2
-vim.o.shiftwidth = 2
-vim.o.expandtab = true
-vim.o.backspace = 'indent,eol,start'
-
--- Enable truecolor and try to apply a builtin colorscheme
-vim.o.termguicolors = true
-pcall(vim.cmd, 'colorscheme elflord')
-
--- Enable filetype detection, plugins, indent
-vim.cmd('filetype plugin indent on')
-
--- Function to setup buffer
-local function setup_buffer(buf)
-  vim.bo[buf].filetype = 'sh'
-  -- Clear and set dictionary
-  vim.opt_local.dictionary = {{ dict_file }}
-  vim.opt_local.complete:append('k')
-  vim.opt_local.completeopt = {{ 'menu', 'menuone', 'preview' }}
-  -- Map Ctrl-Space to trigger dictionary completion for this buffer
-  pcall(vim.keymap.set, 'i', '<C-Space>', '<C-x><C-k>', {{ buffer = buf, noremap = true, silent = true }})
-  -- Debug: verify settings
-  local dict_setting = vim.opt_local.dictionary:get()
-  local complete_setting = vim.opt_local.complete:get()
-  vim.api.nvim_echo({{
-    {{ 'Curl autocomplete: Ctrl+Space or Ctrl+X Ctrl+K', 'Normal' }},
-    {{ '  Dictionary: ' .. (dict_setting[1] or 'not set'), 'Comment' }},
-    {{ '  Complete: ' .. table.concat(complete_setting, ','), 'Comment' }}
-  }}, true, {{}})
-end
-
--- Apply to current buffer immediately
-vim.schedule(function()
-  local current_buf = vim.api.nvim_get_current_buf()
-  setup_buffer(current_buf)
-end)
-
--- Also setup on buffer events
-vim.api.nvim_create_autocmd({{ 'BufEnter', 'BufWinEnter' }}, {{
-  callback = function(args)
-    setup_buffer(args.buf)
-  end,
-  once = false,
-}})
-'''
+        config_content = _NVIM_CONFIG_TEMPLATE % {
+            'dict_file': dict_file_safe,
+            'target_path': target_file_safe,
+        }
         suffix = '.lua'
     else:
         # Vimscript configuration with sanitized paths
         debug_print("Sanitizing paths for Vimscript interpolation...")
-        dict_file_safe = sanitize_vim_string(dict_file)
-        debug_print(f"Sanitized dict_file: {len(dict_file_safe)} chars")
+        # 'dictionary' is a comma-separated list: a comma in the path is escaped
+        # for the option first, then the value is escaped for the string literal
+        dict_file_safe = sanitize_vim_string(dict_file.replace(',', '\\,'))
+        if debug:
+            debug_print(f"Sanitized dict_file: {len(dict_file_safe)} chars")
         
         debug_print("Generating Vimscript configuration...")
-        config_content = f'''set nocompatible
-syntax on
-filetype plugin indent on
-set filetype=sh
-set number
-set autoindent
-set tabstop=2
-set shiftwidth=2
-set expandtab
-set backspace=indent,eol,start
-
-" Enable dictionary completion for curl commands
-set dictionary={dict_file_safe}
-set complete+=k
-set completeopt=menu,menuone,preview
-
-" Show helpful message
-echo "Curl autocomplete available: Press Ctrl+X Ctrl+K in insert mode for completion"
-'''
+        config_content = _VIM_CONFIG_TEMPLATE % {'dict_file': dict_file_safe}
         suffix = '.vimrc'
 
     # Create temporary config file
     # fd: File descriptor (integer) for the opened file
     # config_tmp: Path to the created temporary config file
     # suffix: File extension (.lua for Neovim, .vimrc for Vim)
-    debug_print(f"Creating temporary config file with suffix: {suffix}")
-    fd, config_tmp = tempfile.mkstemp(suffix=suffix)
-    debug_print(f"Created temp config file: {config_tmp} (fd: {fd})")
+    # dir: Shared per-process temp directory (see utils.get_temp_dir)
+    if debug:
+        debug_print(f"Creating temporary config file with suffix: {suffix}")
+    fd, config_tmp = tempfile.mkstemp(suffix=suffix, dir=get_temp_dir())
+    if debug:
+        debug_print(f"Created temp config file: {config_tmp} (fd: {fd})")
     
-    # Add config file to temp_files list for automatic cleanup on exit
-    temp_files.append(config_tmp)
-    debug_print(f"Added config file to cleanup list (total temp files: {len(temp_files)})")
-    debug_print(f"Created editor config at: {config_tmp} (editor={editor}, suffix={suffix})")
+    # Add config file to temp_files set for automatic cleanup on exit
+    temp_files.add(config_tmp)
+    if debug:
+        debug_print(f"Added config file to cleanup set (total temp files: {len(temp_files)})")
+        debug_print(f"Created editor config at: {config_tmp} (editor={editor}, suffix={suffix})")
 
     try:
         # Write config content to file
-        # os.fdopen(): Convert file descriptor to file object
-        # 'w': Write mode (text mode)
-        debug_print(f"Writing config content ({len(config_content)} bytes) to file...")
-        with os.fdopen(fd, 'w') as f:
-            bytes_written = f.write(config_content)
+        # Raw write_all() of the encoded config (no TextIOWrapper needed; short writes retried)
+        payload = config_content.encode('utf-8')
+        if debug:
+            debug_print(f"Writing config content ({len(payload)} bytes) to file...")
+        try:
+            bytes_written = write_all(fd, payload)
+        finally:
+            os.close(fd)
+        if debug:
             debug_print(f"Wrote {bytes_written} bytes to config file")
         
         # If DEBUG mode is enabled, output config file content for debugging
-        if DEBUG:
-            # lines: List of lines from config content (split by newline)
-            lines = config_content.split('\n')
-            debug_print(f"Config file content ({len(config_content)} bytes, {len(lines)} lines):")
-            # Output first 20 lines with line numbers
-            for i, line in enumerate(lines[:20], 1):
-                debug_print(f"  {i:3d}: {line}")
-            total_lines = len(lines)
+        # debug was read from utils.DEBUG at call time (set by cli.main() after import)
+        if debug:
+            # lines: First 20 lines of the config (maxsplit stops after them;
+            #        the 21st item holds the unsplit remainder and is never printed)
+            lines = config_content.split('\n', 20)
+            total_lines = config_content.count('\n') + 1
+            # Build the first 20 numbered lines as one multi-line message (single debug_print)
+            dump = '\n'.join(f"  {i:3d}: {line}" for i, line in enumerate(lines[:20], 1))
             if total_lines > 20:
-                remaining_lines = total_lines - 20
-                debug_print(f"  ... ({remaining_lines} more lines)")
+                dump += f"\n  ... ({total_lines - 20} more lines)"
+            debug_print(f"Config file content ({len(config_content)} bytes, {total_lines} lines):\n{dump}")
     except OSError as e:
         debug_print(f"ERROR: Failed to create config file: {type(e).__name__}: {e}")
         print_error(f"Failed to create config file: {e}")
 
-    debug_print(f"Editor config file created successfully: {config_tmp}")
+    if debug:
+        debug_print(f"Editor config file created successfully: {config_tmp}")
     return config_tmp
 
 
@@ -287,7 +338,7 @@ def open_editor(tmpfile: str) -> None:
         
     Flow:
         1. Get available editor (nvim or vim)
-        2. Create editor configuration file
+        2. Create editor configuration file (reusing the detected editor)
         3. Build editor command with config and template file
         4. Launch editor as subprocess
         5. Wait for editor to close
@@ -305,7 +356,7 @@ def open_editor(tmpfile: str) -> None:
     # Created by create_editor_config() with curl autocomplete settings
     # Contains editor-specific config (Lua for Neovim, Vimscript for Vim)
     debug_print("Creating editor configuration file...")
-    config_tmp = create_editor_config(tmpfile)
+    config_tmp = create_editor_config(tmpfile, editor)
     debug_print(f"Editor config created: {config_tmp}")
 
     try:
@@ -333,8 +384,10 @@ def open_editor(tmpfile: str) -> None:
             debug_print("Building Vim command with vimrc config")
             cmd = [editor, '-u', config_tmp, '+8', '-c', 'normal $', '+startinsert', tmpfile]
         
-        debug_print(f"Editor command: {' '.join(cmd)}")
-        debug_print(f"Launching editor as subprocess (will block until editor closes)...")
+        # The joined command line is only built when it will be printed
+        if utils.DEBUG:
+            debug_print(f"Editor command: {' '.join(cmd)}")
+        debug_print("Launching editor as subprocess (will block until editor closes)...")
         
         # result: CompletedProcess object from subprocess.run()
         # check=True: Raise exception if editor exits with non-zero code
@@ -356,7 +409,7 @@ def open_editor(tmpfile: str) -> None:
         try:
             debug_print(f"Cleaning up editor config file: {config_tmp}")
             os.unlink(config_tmp)  # Delete config file
-            temp_files.remove(config_tmp)  # Remove from temp_files list
+            temp_files.discard(config_tmp)  # Remove from temp_files set (O(1))
             debug_print(f"Editor config file removed (remaining temp files: {len(temp_files)})")
         except OSError as e:
             debug_print(f"Error removing editor config file: {e} (may already be deleted)")
@@ -6,8 +6,8 @@ with appropriate colors and formatting. All output functions use the Colors
 class from constants.py for consistent styling.
 
 Functions:
-    print_error(message: str) -> None
-        Print error message in red and exit with code 1
+    print_error(message: str, fatal: bool = True) -> None
+        Print error message in red and exit with code 1 (unless fatal=False)
         
     print_warning(message: str) -> None
         Print warning message in yellow (non-fatal)
@@ -30,27 +30,41 @@ import sys
 from curlpad.constants import Colors
 from curlpad.utils import cleanup_temp_files
 
+# Colored message prefixes, built once at import (same pattern as the labels in commands.py)
+# Each message is still formatted into one string so print() issues a single write
+_ERROR_PREFIX = f"{Colors.RED}❌ "
+_WARNING_PREFIX = f"{Colors.YELLOW}⚠ "
+_SUCCESS_PREFIX = f"{Colors.GREEN}✅ "
+_INFO_PREFIX = f"{Colors.BLUE}ℹ "
+_RESET = Colors.RESET
 
-def print_error(message: str) -> None:
+
+def print_error(message: str, fatal: bool = True) -> None:
     """
     Print error message in red and exit the program.
     
     This function is used for fatal errors that prevent the program
     from continuing. It prints the message in red with an error emoji,
     cleans up temporary files, and exits with code 1.
+    With fatal=False only the message is printed, for callers that
+    report several failures before exiting once.
     
     Args:
         message: Error message to display
+        fatal: Clean up and exit after printing (default True)
         
     Flow:
         1. Print red error message with ❌ emoji to stderr
-        2. Clean up all temporary files
-        3. Exit program with code 1
+        2. Return here if not fatal
+        3. Clean up all temporary files
+        4. Exit program with code 1
         
     Usage:
         print_error("curl is not installed. Please install curl first.")
     """
-    print(f"{Colors.RED}❌ {message}{Colors.RESET}", file=sys.stderr)
+    print(f"{_ERROR_PREFIX}{message}{_RESET}", file=sys.stderr)
+    if not fatal:
+        return
     cleanup_temp_files()
     sys.exit(1)
 
@@ -69,7 +83,7 @@ def print_warning(message: str) -> None:
     Usage:
         print_warning("No uncommented command found. Exiting.")
     """
-    print(f"{Colors.YELLOW}⚠ {message}{Colors.RESET}", file=sys.stderr)
+    print(f"{_WARNING_PREFIX}{message}{_RESET}", file=sys.stderr)
 
 
 def print_success(message: str) -> None:
@@ -84,7 +98,7 @@ def print_success(message: str) -> None:
     Usage:
         print_success("Dependencies installed.")
     """
-    print(f"{Colors.GREEN}✅ {message}{Colors.RESET}")
+    print(f"{_SUCCESS_PREFIX}{message}{_RESET}")
 
 
 def print_info(message: str) -> None:
@@ -100,5 +114,5 @@ def print_info(message: str) -> None:
     Usage:
         print_info("Installing missing dependencies...")
     """
-    print(f"{Colors.BLUE}ℹ {message}{Colors.RESET}")
+    print(f"{_INFO_PREFIX}{message}{_RESET}")
 
@@ -14,19 +14,150 @@ Functions:
 
 Flow:
     1. create_template_file() creates a .sh file with commented curl examples
-    2. create_curl_dict() creates a .dict file with curl options for autocomplete
-    3. Both files are added to temp_files list for cleanup
+    2. create_curl_dict() returns a .dict file with curl options for autocomplete,
+       kept in the per-user cache directory so it is written once across runs
+    3. The template (and the dictionary, if the cache is unusable) is created in the
+       shared temp directory and added to temp_files set for cleanup
     4. File paths are returned for use by editor module
 """
 
 import os
 import stat
 import tempfile
-from typing import Optional
+import zlib
+from typing import Optional, Tuple
 
-from curlpad.utils import temp_files, debug_print, DEBUG
+from curlpad.constants import CACHE_DIR, IS_WINDOWS
+from curlpad import utils
+from curlpad.utils import temp_files, debug_print, get_temp_dir, write_all
 from curlpad.output import print_error
 
+# _CURL_OPTIONS: curl-related keywords for autocomplete (immutable tuple, built once at import)
+_CURL_OPTIONS: Tuple[str, ...] = (
+    '-X', 'GET', 'POST', 'PUT', 'DELETE', 'PATCH', 'HEAD', 'OPTIONS',
+    '-H', '--header', 'Content-Type:', 'application/json', 'application/xml', 'text/plain',
+    '-d', '--data', '--data-raw', '--data-binary', '--data-urlencode',
+    '--url', '-i', '--include', '-v', '--verbose', '-s', '--silent',
+    '-o', '--output', '-L', '--location', '-k', '--insecure',
+    '--connect-timeout', '--max-time', '-u', '--user', '-x', '--proxy',
+    '--cert', '--key', '--cacert', '-A', '--user-agent',
+    '-b', '--cookie', '-c', '--cookie-jar', '-e', '--referer',
+    '-f', '--fail', '-I', '--head', '-m', '--max-redirs',
+    '--compressed', '--digest', '--negotiate', '--ntlm',
+    'curl', 'curl.exe', 'https://', 'http://', 'localhost', '127.0.0.1'
+)
+
+# _CURL_DICT_BYTES: Dictionary file content (one option per line), joined and encoded once at import
+_CURL_DICT_BYTES = ("\n".join(_CURL_OPTIONS) + "\n").encode('ascii')
+
+# _DICT_CACHE_FILE: Persistent dictionary shared across runs
+# A hash of the content is part of the name, so a changed _CURL_OPTIONS tuple gets a new file
+_DICT_CACHE_FILE = os.path.join(CACHE_DIR, f"curl.{zlib.crc32(_CURL_DICT_BYTES):08x}.dict")
+
+# _EXCL_FLAGS: Flags for creating cache files at a known path
+# O_EXCL makes creation fail if the file exists; O_CLOEXEC keeps the fd out of child processes
+# (not available on Windows, where O_BINARY is used instead)
+_EXCL_FLAGS = (os.O_WRONLY | os.O_CREAT | os.O_EXCL
+               | getattr(os, 'O_CLOEXEC', 0) | getattr(os, 'O_BINARY', 0))
+
+# _curl_dict_path: Temp dictionary file written by create_curl_dict(), reused by later calls
+# The content never changes, so one file per process is enough
+_curl_dict_path: Optional[str] = None
+
+
+def _is_valid_dict_cache(st: os.stat_result) -> bool:
+    """
+    Check that the cached dictionary can be reused as-is.
+
+    st (the stat result of _DICT_CACHE_FILE) must describe a regular file
+    of exactly len(_CURL_DICT_BYTES) bytes, with mode 0o600 and owned by
+    the current user (mode/owner are not checked on Windows). Only then is
+    the file read and its content compared with _CURL_DICT_BYTES.
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    if not (stat.S_ISREG(st.st_mode) and st.st_size == len(_CURL_DICT_BYTES)
+            and (IS_WINDOWS or (stat.S_IMODE(st.st_mode) == 0o600 and st.st_uid == os.getuid()))):
+        return False
+    # One extra byte is requested so a file that grew since the stat() does not match
+    with open(_DICT_CACHE_FILE, 'rb') as f:
+        return f.read(len(_CURL_DICT_BYTES) + 1) == _CURL_DICT_BYTES
+
+
+def _write_new_file(path: str) -> None:
+    """
+    Create path exclusively (O_EXCL, 0o600) and write the dictionary into it.
+
+    Raises:
+        FileExistsError: If path already exists
+        OSError: If the file cannot be created or written (a partial file is removed)
+    """
+    fd = os.open(path, _EXCL_FLAGS, 0o600)
+    try:
+        write_all(fd, _CURL_DICT_BYTES)
+    except OSError:
+        os.close(fd)
+        os.unlink(path)
+        raise
+    os.close(fd)
+
+
+def _cached_curl_dict() -> Optional[str]:
+    """
+    Return the persistent dictionary file, writing it first if needed.
+
+    A missing file is created in place with O_EXCL; if another run created
+    it first, that file is verified instead. A file that fails verification
+    (_is_valid_dict_cache) is rewritten atomically: a sibling
+    <path>.tmp.<pid> is written and moved over it with os.replace.
+    Failures are logged and ignored: the cache is only an optimization.
+
+    Returns:
+        Path to the cached dictionary, or None if the cache directory
+        cannot be used (caller falls back to a temp file)
+    """
+    try:
+        if _is_valid_dict_cache(os.stat(_DICT_CACHE_FILE)):
+            return _DICT_CACHE_FILE
+        debug_print(f"Cached dictionary {_DICT_CACHE_FILE} failed verification; rewriting it")
+        stale = True
+    except FileNotFoundError:
+        debug_print(f"No cached dictionary at {_DICT_CACHE_FILE}; writing it")
+        stale = False
+    except OSError as e:
+        debug_print(f"Cannot inspect cached dictionary: {e}")
+        return None
+
+    try:
+        if not stale:
+            os.makedirs(CACHE_DIR, mode=0o700, exist_ok=True)
+            try:
+                _write_new_file(_DICT_CACHE_FILE)
+            except FileExistsError:
+                # Another curlpad run created it in the meantime
+                if _is_valid_dict_cache(os.stat(_DICT_CACHE_FILE)):
+                    return _DICT_CACHE_FILE
+                stale = True
+        if stale:
+            tmp = f"{_DICT_CACHE_FILE}.tmp.{os.getpid()}"
+            try:
+                _write_new_file(tmp)
+            except FileExistsError:
+                # Leftover from an earlier run with the same pid
+                os.unlink(tmp)
+                _write_new_file(tmp)
+            try:
+                os.replace(tmp, _DICT_CACHE_FILE)
+            except OSError:
+                os.unlink(tmp)
+                raise
+    except OSError as e:
+        debug_print(f"Could not write cached dictionary: {e}")
+        return None
+    debug_print(f"Saved curl dictionary to {_DICT_CACHE_FILE} ({len(_CURL_DICT_BYTES)} bytes)")
+    return _DICT_CACHE_FILE
+
 
 def create_template_file(base_url: Optional[str] = None) -> str:
     """
@@ -34,7 +165,7 @@ def create_template_file(base_url: Optional[str] = None) -> str:
 
     Creates a temporary shell script file with commented curl examples.
     The file is created atomically with proper permissions to prevent TOCTOU attacks.
-    The file is automatically added to temp_files list for cleanup on exit.
+    The file is automatically added to temp_files set for cleanup on exit.
 
     Args:
         base_url: Optional base URL to pre-populate in the curl command.
@@ -54,22 +185,24 @@ def create_template_file(base_url: Optional[str] = None) -> str:
         - Empty line at end (where cursor will be positioned)
 
     Flow:
-        1. Set secure umask atomically
-        2. Create temporary directory (automatically has 0o700 permissions)
-        3. Create temporary file with 0o600 permissions
-        4. Write template content atomically
-        5. Verify permissions
-        6. Add to temp_files list
-        7. Return file path
+        1. Get shared temp directory (0o700 permissions, see utils.get_temp_dir)
+        2. Create temporary file with 0o600 permissions (mkstemp, independent of umask)
+        3. Write template content atomically
+        4. Add to temp_files set
+        5. Return file path
     """
+    # debug: Snapshot of utils.DEBUG; f-string messages are only built when it is set
+    debug = utils.DEBUG
+
     # Platform-specific curl command (curl.exe on Windows, curl on Unix)
-    curl_cmd = "curl.exe" if os.name == 'nt' else "curl"
+    curl_cmd = "curl.exe" if IS_WINDOWS else "curl"
     
     # Build the curl command line
     if base_url:
         # Pre-populate with URL if provided
         curl_line = f'{curl_cmd} "{base_url}"'
-        debug_print(f"Pre-populating template with URL: {base_url}")
+        if debug:
+            debug_print(f"Pre-populating template with URL: {base_url}")
     else:
         # Empty curl command if no URL provided
         curl_line = f'{curl_cmd} '
@@ -85,77 +218,46 @@ def create_template_file(base_url: Optional[str] = None) -> str:
 """
 
     debug_print("Creating template file with secure permissions")
-    debug_print(f"Template content length: {len(template)} bytes")
-    
-    # Set secure umask to ensure 0o700 directory and 0o600 file permissions
-    old_umask = os.umask(0o077)
-    debug_print(f"Set secure umask: 0o077 (old umask was: {oct(old_umask)})")
+    if debug:
+        debug_print(f"Template content length: {len(template)} bytes")
     
+    # No umask swap or chmod needed: mkdtemp() creates the shared directory 0o700 and
+    # mkstemp() opens the file with O_EXCL and mode 0o600, whatever the process umask is
+    # Use the shared per-process temp directory (0o700, removed on cleanup)
+    tdir = get_temp_dir()
+    if debug:
+        debug_print(f"Using shared temp directory: {tdir}")
+
+    # Create temporary file with secure permissions atomically
+    fd, tmpfile = tempfile.mkstemp(suffix=".sh", dir=tdir)
+    if debug:
+        debug_print(f"Created temp file: {tmpfile} (fd: {fd}, mode: 0o600)")
+
     try:
-        # Create temporary directory with secure permissions (0o700 due to umask)
-        debug_print("Creating temporary directory")
-        tdir = tempfile.mkdtemp()
-        debug_print(f"Created temp directory: {tdir}")
-        
-        # Verify directory permissions
-        dir_stat = os.stat(tdir)
-        dir_mode = stat.S_IMODE(dir_stat.st_mode)
-        debug_print(f"Directory permissions: {oct(dir_mode)} (expected: 0o700)")
-        if dir_mode != 0o700:
-            # Force correct permissions if umask didn't work
-            debug_print(f"Forcing secure permissions on temp directory: {tdir}")
-            os.chmod(tdir, 0o700)
-            debug_print(f"Forced secure permissions on temp directory: {tdir}")
-        
-        # Create temporary file with secure permissions atomically
-        debug_print(f"Creating temporary file in directory: {tdir}")
-        fd, tmpfile = tempfile.mkstemp(suffix=".sh", dir=tdir)
-        debug_print(f"Created temp file: {tmpfile} (fd: {fd})")
-        
+        # Write template content atomically via file descriptor
+        # Raw write_all() of the encoded template (no TextIOWrapper needed; short writes retried)
+        payload = template.encode('utf-8')
         try:
-            # Write template content atomically via file descriptor
-            debug_print(f"Writing template content ({len(template)} bytes) to file")
-            with os.fdopen(fd, 'w') as f:
-                bytes_written = f.write(template)
-                debug_print(f"Wrote {bytes_written} bytes to template file")
-            
-            # Set file permissions to 0o600 (owner read/write only)
-            # Use chmod on file path (works on both Unix and Windows)
-            # Note: On Windows, permissions work differently but chmod still works
-            debug_print(f"Setting file permissions to 0o600")
-            try:
-                os.chmod(tmpfile, 0o600)
-            except OSError as e:
-                # On Windows, chmod may fail or work differently
-                debug_print(f"chmod warning on {os.name}: {e}")
-            
-            # Verify file permissions after write (skip strict check on Windows)
-            if os.name != 'nt':  # Only check on Unix-like systems
-                file_stat = os.stat(tmpfile)
-                file_mode = stat.S_IMODE(file_stat.st_mode)
-                debug_print(f"File permissions after write: {oct(file_mode)} (expected: 0o600)")
-                if file_mode != 0o600:
-                    debug_print(f"WARNING: File permissions mismatch! Expected 0o600, got {oct(file_mode)}")
-                    print_error(f"Failed to set secure permissions on template file: {tmpfile}")
-            
-            # Add to cleanup list AFTER successful write
-            temp_files.append(tmpfile)
-            debug_print(f"Added template file to cleanup list (total temp files: {len(temp_files)})")
-            debug_print(f"Created secure template file at: {tmpfile} (mode: 0o600)")
-            
-            return tmpfile
-            
-        except OSError as e:
-            # Clean up file on error
-            try:
-                os.unlink(tmpfile)
-            except OSError:
-                pass
-            print_error(f"Failed to create template file: {e}")
-            
-    finally:
-        # Restore original umask
-        os.umask(old_umask)
+            bytes_written = write_all(fd, payload)
+        finally:
+            os.close(fd)
+        if debug:
+            debug_print(f"Wrote {bytes_written} bytes to template file")
+
+        # Add to cleanup list AFTER successful write
+        temp_files.add(tmpfile)
+        if debug:
+            debug_print(f"Added template file to cleanup set (total temp files: {len(temp_files)})")
+
+        return tmpfile
+
+    except OSError as e:
+        # Clean up file on error
+        try:
+            os.unlink(tmpfile)
+        except OSError:
+            pass
+        print_error(f"Failed to create template file: {e}")
 
 
 def create_curl_dict() -> str:
@@ -166,6 +268,12 @@ def create_curl_dict() -> str:
     common headers, and URLs. This dictionary is used by Vim/Neovim
     for autocomplete when editing curl commands.
 
+    The content is static, so it is kept in the per-user cache directory
+    (_cached_curl_dict) and only written when missing or stale. If the
+    cache cannot be used, a temp file is written once per process; later
+    calls return the same path as long as it still exists and is still
+    tracked for cleanup.
+
     Returns:
         Path to the created dictionary file
 
@@ -179,106 +287,66 @@ def create_curl_dict() -> str:
         - Common URLs: https://, http://, localhost, 127.0.0.1
 
     Flow:
-        1. Set secure umask
-        2. Create temporary directory atomically
-        3. Create temporary file with secure permissions
+        0. Return the cached dictionary if the cache directory is usable
+        1. Return the existing temp dictionary file if one was already written
+        2. Get shared temp directory (0o700 permissions, see utils.get_temp_dir)
+        3. Create temporary file with 0o600 permissions (mkstemp, independent of umask)
         4. Write curl options atomically
-        5. Verify permissions and content
-        6. Return file path
+        5. Return file path
     """
-    # curl_options: List of curl-related keywords for autocomplete
-    curl_options = [
-        '-X', 'GET', 'POST', 'PUT', 'DELETE', 'PATCH', 'HEAD', 'OPTIONS',
-        '-H', '--header', 'Content-Type:', 'application/json', 'application/xml', 'text/plain',
-        '-d', '--data', '--data-raw', '--data-binary', '--data-urlencode',
-        '--url', '-i', '--include', '-v', '--verbose', '-s', '--silent',
-        '-o', '--output', '-L', '--location', '-k', '--insecure',
-        '--connect-timeout', '--max-time', '-u', '--user', '-x', '--proxy',
-        '--cert', '--key', '--cacert', '-A', '--user-agent',
-        '-b', '--cookie', '-c', '--cookie-jar', '-e', '--referer',
-        '-f', '--fail', '-I', '--head', '-m', '--max-redirs',
-        '--compressed', '--digest', '--negotiate', '--ntlm',
-        'curl', 'curl.exe', 'https://', 'http://', 'localhost', '127.0.0.1'
-    ]
-
-    debug_print(f"Creating curl dictionary with {len(curl_options)} entries")
-    
-    # Set secure umask
-    old_umask = os.umask(0o077)
-    debug_print(f"Set secure umask: 0o077 (old umask was: {oct(old_umask)})")
+    # debug: Snapshot of utils.DEBUG; f-string messages are only built when it is set
+    debug = utils.DEBUG
+
+    cached = _cached_curl_dict()
+    if cached is not None:
+        if debug:
+            debug_print(f"Using cached curl dictionary at: {cached}")
+        return cached
+
+    global _curl_dict_path
+    if _curl_dict_path in temp_files and os.path.exists(_curl_dict_path):
+        if debug:
+            debug_print(f"Reusing curl dictionary at: {_curl_dict_path}")
+        return _curl_dict_path
+
+    if debug:
+        debug_print(f"Creating curl dictionary with {len(_CURL_OPTIONS)} entries")
     
+    # Same as create_template_file(): mkstemp() already creates the file 0o600
+    # Use the shared per-process temp directory (0o700, removed on cleanup)
+    tdir = get_temp_dir()
+    if debug:
+        debug_print(f"Using shared temp directory for dictionary: {tdir}")
+
+    # Create temporary dictionary file atomically
+    fd, dict_tmp = tempfile.mkstemp(suffix=".dict", dir=tdir)
+    if debug:
+        debug_print(f"Created temp dictionary file: {dict_tmp} (fd: {fd}, mode: 0o600)")
+
     try:
-        # Create temporary directory with secure permissions
-        debug_print("Creating temporary directory for dictionary")
-        tdir = tempfile.mkdtemp()
-        debug_print(f"Created temp directory: {tdir}")
-        
-        # Verify directory permissions
-        dir_stat = os.stat(tdir)
-        dir_mode = stat.S_IMODE(dir_stat.st_mode)
-        debug_print(f"Directory permissions: {oct(dir_mode)} (expected: 0o700)")
-        if dir_mode != 0o700:
-            debug_print(f"Forcing secure permissions on dict temp directory: {tdir}")
-            os.chmod(tdir, 0o700)
-            debug_print(f"Forced secure permissions on dict temp directory: {tdir}")
-        
-        # Create temporary dictionary file atomically
-        debug_print(f"Creating temporary dictionary file in directory: {tdir}")
-        fd, dict_tmp = tempfile.mkstemp(suffix=".dict", dir=tdir)
-        debug_print(f"Created temp dictionary file: {dict_tmp} (fd: {fd})")
-        
+        # Write dictionary content atomically via file descriptor
+        # Raw write_all() of the pre-encoded bytes (no TextIOWrapper needed; short writes retried)
         try:
-            # Write dictionary content atomically via file descriptor
-            debug_print(f"Writing {len(curl_options)} dictionary entries to file")
-            total_bytes = 0
-            with os.fdopen(fd, 'w') as f:
-                for option in curl_options:
-                    bytes_written = f.write(f"{option}\n")
-                    total_bytes += bytes_written
-            debug_print(f"Wrote {total_bytes} bytes ({len(curl_options)} entries) to dictionary file")
-            
-            # Set file permissions to 0o600
-            # Use chmod on file path (works on both Unix and Windows)
-            # Note: On Windows, permissions work differently but chmod still works
-            debug_print(f"Setting dictionary file permissions to 0o600")
-            try:
-                os.chmod(dict_tmp, 0o600)
-            except OSError as e:
-                # On Windows, chmod may fail or work differently
-                debug_print(f"chmod warning on {os.name}: {e}")
-            
-            # Verify file permissions (skip strict check on Windows)
-            if os.name != 'nt':  # Only check on Unix-like systems
-                file_stat = os.stat(dict_tmp)
-                file_mode = stat.S_IMODE(file_stat.st_mode)
-                debug_print(f"Dictionary file permissions after write: {oct(file_mode)} (expected: 0o600)")
-                if file_mode != 0o600:
-                    debug_print(f"WARNING: Dictionary file permissions mismatch! Expected 0o600, got {oct(file_mode)}")
-                    print_error(f"Failed to set secure permissions on dictionary file: {dict_tmp}")
-            
-            # Add to cleanup list AFTER successful write
-            temp_files.append(dict_tmp)
-            debug_print(f"Added dictionary file to cleanup list (total temp files: {len(temp_files)})")
-            debug_print(f"Created secure curl dictionary at: {dict_tmp} with {len(curl_options)} entries (mode: 0o600)")
-            
-            # Verify content if DEBUG enabled
-            if DEBUG:
-                debug_print("Verifying dictionary file content...")
-                with open(dict_tmp, 'r') as vf:
-                    lines = vf.readlines()
-                    debug_print(f"Dictionary file verified: {len(lines)} lines, first 5: {[l.strip() for l in lines[:5]]}")
-            
-            return dict_tmp
-            
-        except OSError as e:
-            # Clean up file on error
-            try:
-                os.unlink(dict_tmp)
-            except OSError:
-                pass
-            print_error(f"Failed to create dictionary file: {e}")
-            
-    finally:
-        # Restore original umask
-        os.umask(old_umask)
+            total_bytes = write_all(fd, _CURL_DICT_BYTES)
+        finally:
+            os.close(fd)
+        if debug:
+            debug_print(f"Wrote {total_bytes} bytes ({len(_CURL_OPTIONS)} entries) to dictionary file")
 
+        # Add to cleanup list AFTER successful write
+        temp_files.add(dict_tmp)
+        if debug:
+            debug_print(f"Added dictionary file to cleanup set (total temp files: {len(temp_files)})")
+            # Content is already in memory (_CURL_OPTIONS); no need to re-read the file
+            debug_print(f"Dictionary content: {len(_CURL_OPTIONS)} lines, first 5: {_CURL_OPTIONS[:5]}")
+
+        _curl_dict_path = dict_tmp
+        return dict_tmp
+
+    except OSError as e:
+        # Clean up file on error
+        try:
+            os.unlink(dict_tmp)
+        except OSError:
+            pass
+        print_error(f"Failed to create dictionary file: {e}")
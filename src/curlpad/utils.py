@@ -5,11 +5,13 @@ This module provides utility functions for:
     - Debug logging with timestamps
     - Temporary file management and cleanup
     - Signal handling for graceful shutdown
-    - Global state management (DEBUG flag, temp_files list)
+    - Global state management (DEBUG flag, temp_files set)
 
 Global Variables:
-    temp_files: List[str] - Tracks all temporary files created during execution
+    temp_files: Set[str] - Tracks all temporary files created during execution
                           Used for cleanup on exit or error
+    _temp_dir: Optional[TemporaryDirectory] - Shared per-process directory that
+                          holds every curlpad temp file (created lazily)
     DEBUG: bool - Global debug flag that enables verbose logging
                  Set via --debug CLI flag
 
@@ -17,38 +19,60 @@ Functions:
     debug_print(message: str) -> None
         Print debug message with timestamp when DEBUG is enabled
         
+    get_temp_dir() -> str
+        Return the shared temp directory, creating it on first use
+        
+    write_all(fd: int, data: bytes) -> int
+        Write every byte of data to a file descriptor
+        
     cleanup_temp_files() -> None
-        Remove all tracked temporary files
+        Remove all tracked temporary files and the shared temp directory
         
     signal_handler(signum, frame) -> None
         Handle SIGINT/SIGTERM signals and cleanup before exit
+        (installed together with the atexit hook on the first get_temp_dir() call)
 
 Flow:
-    1. Application starts, temp_files list is empty, DEBUG is False
+    1. Application starts, temp_files set is empty, DEBUG is False
     2. User runs with --debug flag -> DEBUG is set to True
-    3. Functions create temp files -> added to temp_files list
+    3. Functions create temp files inside get_temp_dir() -> added to temp_files set
     4. On exit (normal or signal) -> cleanup_temp_files() removes all temp files
+       and the shared temp directory
 """
 
 import atexit
 import os
 import signal
 import sys
-from datetime import datetime
-from typing import List
+import tempfile
+import time
+from typing import List, Optional, Set
 
 from curlpad.constants import Colors
 
 # Global state variables
 # temp_files: Tracks all temporary files created during execution for cleanup
-#             Each module that creates temp files should append to this list
-temp_files: List[str] = []
+#             Each module that creates temp files should add to this set
+#             A set gives O(1) add/discard when files are untracked early (e.g. editor config)
+temp_files: Set[str] = set()
 
 # DEBUG: Global debug flag that enables verbose logging
 #        Set to True via --debug CLI flag in cli.py
 #        When True, debug_print() will output messages with timestamps
 DEBUG = False
 
+# _last_ts_sec/_last_ts_str: Last formatted debug timestamp and the second it was built for
+#                             Log bursts within the same second reuse the string
+_last_ts_sec = -1
+_last_ts_str = ''
+
+# _temp_dir: Shared directory for all temp files of this process
+#            Created on first get_temp_dir() call, removed by cleanup_temp_files()
+_temp_dir: Optional[tempfile.TemporaryDirectory] = None
+
+# _cleanup_installed: True once _ensure_cleanup_installed() has registered atexit/signal handlers
+_cleanup_installed = False
+
 
 def debug_print(message: str) -> None:
     """
@@ -65,18 +89,79 @@ def debug_print(message: str) -> None:
         debug_print("Creating template file at: /tmp/file.sh")
         # Output (if DEBUG=True): [DEBUG 2023-11-06 14:30:45] Creating template file at: /tmp/file.sh
     """
+    global _last_ts_sec, _last_ts_str
     if DEBUG:
-        ts = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        print(f"{Colors.MAGENTA}[DEBUG {ts}] {message}{Colors.RESET}")
+        # time.strftime() avoids building a datetime object per message;
+        # the formatted string is only rebuilt when the second changes
+        now = int(time.time())
+        if now != _last_ts_sec:
+            _last_ts_str = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now))
+            _last_ts_sec = now
+        print(f"{Colors.MAGENTA}[DEBUG {_last_ts_str}] {message}{Colors.RESET}")
+
+
+def get_temp_dir() -> str:
+    """
+    Return the shared temp directory, creating it on first use.
+    
+    All curlpad temp files (template, dictionary, editor config) live in one
+    directory so a single removal cleans up everything, including the
+    directory itself. tempfile.mkdtemp() creates it with 0o700 permissions.
+    
+    Returns:
+        Path to the shared temp directory
+        
+    Usage:
+        fd, path = tempfile.mkstemp(suffix=".sh", dir=get_temp_dir())
+    """
+    global _temp_dir
+    if _temp_dir is None:
+        # First temp file of the process: make sure it is cleaned up on exit/signal
+        _ensure_cleanup_installed()
+        _temp_dir = tempfile.TemporaryDirectory(prefix="curlpad-")
+        debug_print(f"Created shared temp directory: {_temp_dir.name}")
+    return _temp_dir.name
+
+
+def write_all(fd: int, data: bytes) -> int:
+    """
+    Write every byte of data to a file descriptor.
+    
+    os.write() may write fewer bytes than requested (short write), so it
+    is repeated on the remaining bytes until everything is written.
+    
+    Args:
+        fd: File descriptor opened for writing
+        data: Bytes to write
+        
+    Returns:
+        Number of bytes written (always len(data))
+        
+    Raises:
+        OSError: If a write fails
+        
+    Usage:
+        write_all(fd, template.encode('utf-8'))
+    """
+    written = os.write(fd, data)
+    if written < len(data):
+        # Rare: only copy into a memoryview when the first write came up short
+        view = memoryview(data)
+        while written < len(data):
+            written += os.write(fd, view[written:])
+    return written
 
 
 def cleanup_temp_files() -> None:
     """
     Remove all tracked temporary files.
     
-    This function iterates through the global temp_files list and
-    attempts to delete each file. Errors during deletion are silently
-    ignored to prevent cleanup failures from masking real errors.
+    This function iterates over a snapshot of the global temp_files set and
+    attempts to delete each file that is not inside the shared temp
+    directory, then removes the shared temp directory (and with it every
+    file in it) in one go.
+    Errors during deletion are silently ignored to prevent cleanup
+    failures from masking real errors.
     
     Called automatically on:
         - Normal program exit (via atexit.register)
@@ -84,29 +169,51 @@ def cleanup_temp_files() -> None:
         - Error conditions (via print_error in output.py)
         
     Flow:
-        1. Iterate through temp_files list
-        2. Check if file exists
-        3. Attempt to delete (os.unlink)
-        4. Ignore errors (file may already be deleted)
+        1. Iterate through a snapshot of temp_files (tolerates mutation),
+           skipping files inside the shared temp directory
+        2. Attempt to delete (os.unlink, no exists() check first)
+        3. Ignore errors (file may already be deleted)
+        4. Clear temp_files so a repeated call does nothing
+        5. Remove the shared temp directory (if created)
     """
-    debug_print(f"Cleanup starting for {len(temp_files)} temp file(s)")
-    if not temp_files:
-        debug_print("No temp files to clean up")
-        return
+    global _temp_dir
+    # debug: Snapshot of DEBUG; per-file messages are only built when it is set
+    debug = DEBUG
+    total = len(temp_files)
+    if debug:
+        debug_print(f"Cleanup starting for {total} temp file(s)")
     
-    for i, temp_file in enumerate(temp_files, 1):
+    # Files inside the shared temp directory go away with its single removal below;
+    # only files tracked elsewhere need their own unlink
+    shared_dir = _temp_dir.name if _temp_dir is not None else None
+    for i, temp_file in enumerate(list(temp_files), 1):
+        if shared_dir is not None and os.path.dirname(temp_file) == shared_dir:
+            continue
+        # unlink() directly: an exists() check first would be an extra stat and a race
         try:
-            if os.path.exists(temp_file):
-                debug_print(f"Removing temp file {i}/{len(temp_files)}: {temp_file}")
-                os.unlink(temp_file)
-                debug_print(f"Successfully removed: {temp_file}")
-            else:
-                debug_print(f"Temp file {i}/{len(temp_files)} already deleted: {temp_file}")
+            os.unlink(temp_file)
+            if debug:
+                debug_print(f"Removed temp file {i}/{total}: {temp_file}")
+        except FileNotFoundError:
+            if debug:
+                debug_print(f"Temp file {i}/{total} already deleted: {temp_file}")
         except OSError as e:
-            debug_print(f"Error removing temp file {i}/{len(temp_files)}: {temp_file} - {e}")
-            pass  # Ignore cleanup errors
+            if debug:
+                debug_print(f"Error removing temp file {i}/{total}: {temp_file} - {e}")
+            # Ignore cleanup errors
+    # Everything tracked is gone (or unremovable); a second call (atexit after a signal) is a no-op
+    temp_files.clear()
+    
+    if debug:
+        debug_print(f"Cleanup complete: {total} temp file(s) processed")
     
-    debug_print(f"Cleanup complete: {len(temp_files)} temp file(s) processed")
+    if _temp_dir is not None:
+        debug_print(f"Removing shared temp directory: {_temp_dir.name}")
+        try:
+            _temp_dir.cleanup()
+        except OSError as e:
+            debug_print(f"Error removing shared temp directory: {e}")
+        _temp_dir = None
 
 
 def signal_handler(signum, frame) -> None:
@@ -127,25 +234,49 @@ def signal_handler(signum, frame) -> None:
         3. cleanup_temp_files() removes all temp files
         4. sys.exit(1) terminates the program
     """
-    signal_name = signal.Signals(signum).name if hasattr(signal, 'Signals') else f"signal {signum}"
-    debug_print(f"Signal handler called: {signal_name} (signum={signum})")
-    debug_print("Cleaning up temp files before exit...")
+    # Keep the kill path short: the number is enough, and the message is only built under DEBUG
+    if DEBUG:
+        debug_print(f"Signal handler called (signum={signum}), cleaning up temp files before exit")
     cleanup_temp_files()
     debug_print("Exiting due to signal")
     sys.exit(1)
 
 
-# Register cleanup function to run on normal exit
-# This ensures temp files are removed even if program exits normally
-atexit.register(cleanup_temp_files)
-if DEBUG:
+def _ensure_cleanup_installed() -> None:
+    """
+    Register the atexit hook and SIGINT/SIGTERM handlers (once).
+
+    Called by get_temp_dir() when the first temp file location is handed
+    out: until then there is nothing to clean up, so importing curlpad
+    (tests, REPL, --help/--version) leaves the host's handlers alone.
+
+    Flow:
+        1. Return immediately if already installed
+        2. Register cleanup_temp_files with atexit
+        3. Install signal_handler for SIGINT/SIGTERM
+    """
+    global _cleanup_installed
+    if _cleanup_installed:
+        return
+    _cleanup_installed = True
+
+    # Register cleanup function to run on normal exit
+    # This ensures temp files are removed even if program exits normally
+    atexit.register(cleanup_temp_files)
     debug_print("Registered atexit handler for temp file cleanup")
 
-# Register signal handlers for graceful shutdown
-# SIGINT: Interrupt signal (Ctrl+C)
-# SIGTERM: Termination signal (kill command)
-signal.signal(signal.SIGINT, signal_handler)
-signal.signal(signal.SIGTERM, signal_handler)
-if DEBUG:
-    debug_print("Registered signal handlers: SIGINT, SIGTERM")
+    # Register signal handlers for graceful shutdown
+    # SIGINT: Interrupt signal (Ctrl+C)
+    # SIGTERM: Termination signal (kill command)
+    # installed: Names of the signals whose handler was set, for the debug message
+    installed: List[str] = []
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        try:
+            signal.signal(signum, signal_handler)
+            installed.append(signum.name)
+        except ValueError:
+            # signal.signal() only works in the main thread; atexit still covers normal exit
+            debug_print(f"Cannot install handler for signal {signum} outside the main thread")
+    if DEBUG and installed:
+        debug_print(f"Registered signal handlers: {', '.join(installed)}")
 